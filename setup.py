@@ -19,7 +19,6 @@ setup(
     include_package_data=True,
     install_requires=[
         "click",
-        "click-completion",
         "tqdm",
         "pathspec",
         "python-crontab",
@@ -28,7 +27,6 @@ setup(
         "sseclient-py",
         "brotli",
         "tiktoken>=0.8.0",
-        "setuptools>=42.0.0",
     ],
     setup_requires=[
         "wheel>=0.37.0",
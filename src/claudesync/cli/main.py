@@ -1,54 +1,180 @@
+import importlib
+import os
 from pathlib import Path
 
 import click
-import click_completion
-import click_completion.core
-import json
-import subprocess
-import urllib.request
-from pkg_resources import get_distribution
-
-from claudesync.cli.export import export
-from claudesync.cli.file import file
-from claudesync.cli.chat import chat
-from claudesync.configmanager import FileConfigManager
-from claudesync.exceptions import ConfigurationError
+
 from claudesync.utils import handle_errors
-from .auth import auth
-from .organization import organization
-from .project import project
-from .simulate import simulate_push
-from .config import config
-from .zip import zip
-from .tokens import tokens
-from .sync_logic import push_files
 import logging
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+# Commands that neither read the configuration nor log anything.
+STATELESS_COMMANDS = {"install-completion"}
+
+# Shell startup file (relative to the home directory) and the line that enables
+# click's built-in completion for it.
+COMPLETION_SCRIPTS = {
+    "bash": (
+        ".bashrc",
+        'eval "$(_CLAUDESYNC_COMPLETE=bash_source claudesync)"',
+    ),
+    "zsh": (
+        ".zshrc",
+        'eval "$(_CLAUDESYNC_COMPLETE=zsh_source claudesync)"',
+    ),
+    "fish": (
+        ".config/fish/completions/claudesync.fish",
+        "_CLAUDESYNC_COMPLETE=fish_source claudesync | source",
+    ),
+}
+
+
+class LazyGroup(click.Group):
+    """
+    A click group that imports its subcommands only when they are invoked.
+
+    Subcommands are registered as a mapping from command name to a pair of an
+    import path of the form "module:attribute" and the command's help text. The
+    module is imported the first time the command is looked up, so a single
+    subcommand does not pay the import cost of every other command module. The
+    command list of `claudesync --help` is built from the stored help texts, so
+    it imports none of them.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._load_lazy_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        # Like click.Group.format_commands, but without looking up (and so
+        # importing) the lazy commands just for their help texts
+        commands = []
+        for cmd_name in self.list_commands(ctx):
+            if cmd_name in self.lazy_subcommands:
+                cmd = click.Command(cmd_name, help=self.lazy_subcommands[cmd_name][1])
+            else:
+                cmd = super().get_command(ctx, cmd_name)
+                if cmd is None or cmd.hidden:
+                    continue
+            commands.append((cmd_name, cmd))
+
+        if commands:
+            limit = formatter.width - 6 - max(len(cmd_name) for cmd_name, _ in commands)
+            rows = [(cmd_name, cmd.get_short_help_str(limit)) for cmd_name, cmd in commands]
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
 
-click_completion.init()
+    def _load_lazy_command(self, cmd_name):
+        module_name, attr_name = self.lazy_subcommands[cmd_name][0].split(":", 1)
+        module = importlib.import_module(module_name)
+        return getattr(module, attr_name)
 
 
-@click.group()
+def setup_logging(config):
+    """
+    Configure the root logger using the configured log level.
+
+    This runs after argument parsing, so `--help` and stateless commands never pay
+    for handler setup. If a handler is already installed only the level is updated.
+    """
+    log_level = getattr(logging, str(config.get("log_level", "INFO")).upper(), logging.INFO)
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        if root_logger.level != log_level:
+            root_logger.setLevel(log_level)
+        return
+    logging.basicConfig(
+        level=log_level, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "auth": (
+            "claudesync.cli.auth:auth",
+            "Manage authentication.",
+        ),
+        "chat": (
+            "claudesync.cli.chat:chat",
+            "Manage and synchronize chats.",
+        ),
+        "config": (
+            "claudesync.cli.config:config",
+            "Manage claudesync configuration.",
+        ),
+        "export": (
+            "claudesync.cli.export:export",
+            "Export all files that would be synchronized into a single file.",
+        ),
+        "file": (
+            "claudesync.cli.file:file",
+            "Manage remote project files.",
+        ),
+        "organization": (
+            "claudesync.cli.organization:organization",
+            "Manage AI organizations.",
+        ),
+        "project": (
+            "claudesync.cli.project:project",
+            "Manage AI projects within the active organization.",
+        ),
+        "simulate-push": (
+            "claudesync.cli.simulate:simulate_push",
+            "Launch a visualization of files to be synchronized.",
+        ),
+        "tokens": (
+            "claudesync.cli.tokens:tokens",
+            "Count tokens in files that would be synchronized.",
+        ),
+        "zip": (
+            "claudesync.cli.zip:zip",
+            "Create a ZIP file containing all files that would be synchronized.",
+        ),
+    },
+)
 @click.pass_context
 def cli(ctx):
     """ClaudeSync: Synchronize local files with AI projects."""
+    if ctx.invoked_subcommand in STATELESS_COMMANDS:
+        # Fast path: no configuration lookup or logging setup needed
+        return
+
     if ctx.obj is None:
+        from claudesync.configmanager import FileConfigManager
+
         ctx.obj = FileConfigManager()  # InMemoryConfigManager() for testing with mock
+    setup_logging(ctx.obj)
 
 
 @cli.command()
-@click.argument(
-    "shell", required=False, type=click.Choice(["bash", "zsh", "fish", "powershell"])
-)
+@click.argument("shell", required=False, type=click.Choice(list(COMPLETION_SCRIPTS)))
 def install_completion(shell):
     """Install completion for the specified shell."""
     if shell is None:
-        shell = click_completion.get_auto_shell()
+        shell = os.path.basename(os.environ.get("SHELL", ""))
+        if shell not in COMPLETION_SCRIPTS:
+            raise click.UsageError(
+                f"Could not detect a supported shell. Please specify one of: {', '.join(COMPLETION_SCRIPTS)}"
+            )
         click.echo("Shell is set to '%s'" % shell)
-    click_completion.install(shell=shell)
+
+    script_name, source_line = COMPLETION_SCRIPTS[shell]
+    script_file = Path.home() / script_name
+    script_file.parent.mkdir(parents=True, exist_ok=True)
+    existing = script_file.read_text() if script_file.exists() else ""
+    if source_line not in existing.splitlines():
+        with open(script_file, "a") as f:
+            if existing and not existing.endswith("\n"):
+                f.write("\n")
+            f.write(source_line + "\n")
     click.echo("Completion installed.")
 
 
@@ -58,19 +184,10 @@ def install_completion(shell):
 @handle_errors
 def push(config, project):
     """Synchronize the project files."""
-    push_files(config, project)
+    from .sync_logic import push_files
 
+    push_files(config, project)
 
-cli.add_command(auth)
-cli.add_command(organization)
-cli.add_command(project)
-cli.add_command(config)
-cli.add_command(chat)
-cli.add_command(simulate_push)
-cli.add_command(file)
-cli.add_command(zip)
-cli.add_command(tokens)
-cli.add_command(export)
 
 if __name__ == "__main__":
-    cli()
\ No newline at end of file
+    cli()
@@ -5,12 +5,9 @@ import click
 import os
 import logging
 
-from tqdm import tqdm
-from ..provider_factory import get_provider
 from ..utils import handle_errors, validate_and_get_provider
 from ..exceptions import ProviderError, ConfigurationError
 from .file import file
-from ..syncmanager import retry_on_403
 
 logger = logging.getLogger(__name__)
 
@@ -20,14 +17,14 @@ def project():
     """Manage AI projects within the active organization."""
     pass
 
-def get_default_internal_name():
+def get_default_internal_name(config):
     """
     Determine default internal name based on existing projects.
     Returns 'all' if no projects exist, None otherwise.
-    """
-    from claudesync.configmanager import FileConfigManager
 
-    config = FileConfigManager()
+    Args:
+        config: The configuration manager of the current invocation
+    """
     try:
         projects = config.get_projects()
         return 'all' if not projects else None
@@ -69,7 +66,7 @@ def ensure_gitignore_entries(claudesync_dir, internal_name=None):
     # Check if entries already exist
     with open(gitignore_path, 'r') as f:
         content = f.read()
-        lines = content.splitlines()
+        lines = set(content.splitlines())
 
     # Find entries to add (those not already in .gitignore)
     new_entries = [entry for entry in entries_to_add
@@ -131,21 +128,25 @@ def create(ctx, template, name, internal_name, description, organization, no_git
     2. Using an existing project as template:
        claudesync project create --template existing-project
     """
+    from ..provider_factory import get_provider
+
     config = ctx.obj
     provider_instance = get_provider(config)
 
+    # Resolve the current directory and its .claudesync directory once
+    current_dir = Path.cwd()
+    claudesync_dir = current_dir / ".claudesync"
+
     # Handle configuration from template if provided
     if template:
         try:
             # Look for template in .claudesync directory
-            claudesync_dir = Path.cwd() / ".claudesync"
             template_file = claudesync_dir / f"{template}.project.json"
 
             if not template_file.exists():
                 raise ConfigurationError(f"Template project configuration not found: {template_file}")
 
-            with open(template_file, 'r') as f:
-                template_config = json.load(f)
+            template_config = json.loads(template_file.read_bytes())
 
             # Extract project name from template if not provided via CLI
             name = name or template_config.get('project_name')
@@ -171,10 +172,10 @@ def create(ctx, template, name, internal_name, description, organization, no_git
     else:
         # Interactive mode - prompt for required values if not provided
         if not name:
-            name = click.prompt("Enter a title for your new project", default=Path.cwd().name)
+            name = click.prompt("Enter a title for your new project", default=current_dir.name)
 
         if not internal_name:
-            default_internal = get_default_internal_name()
+            default_internal = get_default_internal_name(config)
             internal_name = click.prompt("Enter the internal name for your project (used for config files)",
                                          default=default_internal)
 
@@ -187,11 +188,7 @@ def create(ctx, template, name, internal_name, description, organization, no_git
     organization_instance = organizations[0] if organizations else None
     organization_id = organization or organization_instance["id"]
 
-    # Get the current directory
-    current_dir = Path.cwd()
-
     # Create .claudesync directory if it doesn't exist
-    claudesync_dir = current_dir / ".claudesync"
     os.makedirs(claudesync_dir, exist_ok=True)
 
     # Check if project config already exists
@@ -238,20 +235,19 @@ def create(ctx, template, name, internal_name, description, organization, no_git
                 }
 
             # Save files configuration
-            project_config_path = claudesync_dir / f"{internal_name}.project.json"
             with open(project_config_path, 'w') as f:
                 json.dump(project_config, f, indent=2)
 
         # Determine if internal_name contains a path
-        config_path = Path(internal_name)
-        if len(config_path.parts) > 1:
+        config_parent = os.path.dirname(internal_name)
+        if config_parent:
             # Create subdirectories if needed
-            os.makedirs(claudesync_dir / config_path.parent, exist_ok=True)
+            os.makedirs(claudesync_dir / config_parent, exist_ok=True)
 
         # Save project configuration
+        # Machine-generated and never hand-edited, so written compactly
         project_id_config_path = claudesync_dir / f"{internal_name}.project_id.json"
-        with open(project_id_config_path, 'w') as f:
-            json.dump(project_id_config, f, indent=2)
+        project_id_config_path.write_text(json.dumps(project_id_config))
 
         # Set as active project
         config.set_active_project(internal_name, new_project["uuid"])
@@ -271,11 +267,11 @@ def create(ctx, template, name, internal_name, description, organization, no_git
     except (ProviderError, ConfigurationError) as e:
         click.echo(f"Failed to create project: {str(e)}")
 
-@project.command()
+@project.command("set")
 @click.argument("project-path", required=True)
 @click.pass_obj
 @handle_errors
-def set(config, project_path):
+def set_project(config, project_path):
     """Set the active project.
 
     PROJECT_PATH: The project path like 'datamodel/typeconstraints' or 'myproject'"""
@@ -344,28 +340,32 @@ def ls(config):
         # Get active project for comparison
         active_project_path, active_project_id = config.get_active_project()
 
-        click.echo("\nConfigured projects:")
+        # Assemble the listing and write it in one go
+        lines = ["\nConfigured projects:\n"]
         for project_path, project_id in projects.items():
             # Get project details from project configuration
             try:
                 files_config = config.get_files_config(project_path)
-                project_name = files_config.get('project_name', 'Unknown Project')
-
-                # Mark active project with an asterisk
-                active_marker = "*" if project_path == active_project_path else " "
-
-                click.echo(f"{active_marker} {project_name}")
-                click.echo(f"  - Path: {project_path}")
-                click.echo(f"  - ID: {project_id}")
-                click.echo(f"  - URL: https://claude.ai/project/{project_id}")
-                click.echo()
-
             except ConfigurationError:
                 # Skip projects with missing or invalid configuration
                 continue
+            project_name = files_config.get('project_name', 'Unknown Project')
+
+            # Mark active project with an asterisk
+            active_marker = "*" if project_path == active_project_path else " "
+
+            lines.append(
+                f"{active_marker} {project_name}\n"
+                f"  - Path: {project_path}\n"
+                f"  - ID: {project_id}\n"
+                f"  - URL: https://claude.ai/project/{project_id}\n"
+                "\n"
+            )
 
         if active_project_path:
-            click.echo("Note: Projects marked with * are currently active")
+            lines.append("Note: Projects marked with * are currently active\n")
+
+        click.echo("".join(lines), nl=False)
 
     except ConfigurationError as e:
         click.echo(f"Error: {str(e)}")
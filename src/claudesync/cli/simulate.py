@@ -1,20 +1,33 @@
+import functools
+import gzip
+import hashlib
+import shutil
+import stat
+import sys
 import traceback
+import zlib
 
 import click
 import logging
 import os
 import json
 import http.server
+import queue
 import socketserver
 import webbrowser
 import threading
-from urllib.parse import urlparse, parse_qs
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, parse_qs, quote
 from pathlib import Path
 
 from pathspec import pathspec
 
 from ..exceptions import ConfigurationError
-from ..utils import get_local_files, load_gitignore, load_claudeignore
+from ..utils import (
+    get_local_files, load_gitignore, load_claudeignore, union_pathspec, dir_mtime_ns, dir_mtimes_unchanged,
+    EXCLUDED_DIRS, format_size,
+)
 from ..configmanager import FileConfigManager
 from typing import Dict, List, Optional, TypedDict
 from .sync_logic import push_files
@@ -25,6 +38,32 @@ from claudesync.utils import load_gitignore, load_claudeignore
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Threads serving simulate-push requests concurrently
+SERVER_WORKERS = 8
+# Threads listing directories concurrently when dropped files are resolved
+WALK_WORKERS = 8
+# Seconds a client may stay silent mid-request before its connection is
+# dropped, so a stalled connection does not hold one of the workers
+REQUEST_TIMEOUT = 30
+
+# JSON responses at least this large are gzip-compressed if the client accepts it
+GZIP_MIN_SIZE = 1024
+# Streamed responses are written to the socket in blocks of about this many bytes
+STREAM_WRITE_SIZE = 64 * 1024
+# Files viewed through /api/file-content are kept in memory only up to this size
+FILE_CONTENT_CACHE_MAX_SIZE = 256 * 1024
+
+# Serializes the read-modify-write of project configuration updates. Requests
+# are served concurrently, and two overlapping edits would otherwise both start
+# from the same file and one of them would be lost.
+CONFIG_UPDATE_LOCK = threading.Lock()
+# Held while a push runs. A second push started meanwhile, e.g. by a double
+# click, would upload and delete the same remote files concurrently.
+PUSH_LOCK = threading.Lock()
+
+# Shared compact encoder; json.dumps with non-default options builds a new one per call
+COMPACT_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
 class TreeNode(TypedDict):
     name: str
     size: Optional[int]
@@ -32,76 +71,109 @@ class TreeNode(TypedDict):
     children: Optional[List['TreeNode']]
     included: Optional[bool]
 
-def build_file_tree(base_path: str, files_to_sync: Dict[str, str], config, files_config) -> dict:
+def build_file_tree(base_path: str, files_to_sync: Dict[str, str],
+                    file_sizes: Optional[Dict[str, int]] = None) -> dict:
     """
     Build a hierarchical tree structure from the list of files with support for multiple roots.
     This optimized version avoids walking the entire directory tree when show_only_included=True
+
+    Sizes are taken from file_sizes when given (as collected by get_local_files),
+    so the tree is built without touching the file system.
+
+    The tree is returned in columnar form rather than as one dict per node, with
+    directories and files in separate columns so directories carry no size:
+    directory row i has name dirs['names'][i] and parent directory row
+    dirs['parents'][i], and file row j has name files['names'][j], size
+    files['sizes'][j] and parent directory row files['parents'][j]. Directory
+    row 0 is the root, and every directory row comes after its parent. All files
+    in the tree are included.
     """
     logger = logging.getLogger(__name__)
 
     # Create root node
-    root = {
-        'name': 'root',
-        'children': []
-    }
-
-    # Create a set of files that will be synced for quick lookup
-    sync_files = set(files_to_sync.keys())
+    dir_names = ['root']
+    dir_parents = [-1]
+    file_names = []
+    file_parents = []
+    file_row_sizes = []
 
     # Optimized path: build tree directly from included files without directory walking
-    logger.debug(f"Using optimized tree building for {len(sync_files)} included files")
-
-    # Dictionary to track created directory nodes to avoid redundant creation
-    dir_nodes = {}
-
-    # Process each included file
-    for rel_path in sorted(sync_files):  # Sort for consistent results
-        full_path = os.path.join(base_path, rel_path)
-
-        # Skip if file doesn't exist anymore
-        if not os.path.exists(full_path):
-            continue
-
-        # Get file size
-        try:
-            file_size = os.path.getsize(full_path)
-        except OSError:
-            continue
-
-        # Build directory path in tree efficiently
-        path_parts = Path(rel_path).parts
-        file_name = path_parts[-1]
-        dir_path = path_parts[:-1]
-
-        # Ensure parent directories exist
-        current = root
-        current_path = []
-
-        for part in dir_path:
-            current_path.append(part)
-            path_key = '/'.join(current_path)
-
-            # Only create directory node if it doesn't exist yet
-            if path_key not in dir_nodes:
-                dir_node = {
-                    'name': part,
-                    'children': []
-                }
-                current['children'].append(dir_node)
-                dir_nodes[path_key] = dir_node
-
-            current = dir_nodes[path_key]
+    logger.debug(f"Using optimized tree building for {len(files_to_sync)} included files")
+
+    # Directory path, as it appears in the file paths, to its row. Files arrive
+    # grouped by directory, so most files are placed with one lookup.
+    dir_rows = {'': 0}
+
+    # Process each included file in traversal order. It is stable for an
+    # unchanged tree, so the files need not be sorted first.
+    for rel_path in files_to_sync:
+        file_size = file_sizes.get(rel_path) if file_sizes is not None else None
+        if file_size is None:
+            # A single stat gives the size and tells whether the file still exists
+            try:
+                file_size = os.stat(os.path.join(base_path, rel_path)).st_size
+            except OSError:
+                continue
 
-        # Add the file node
-        current['children'].append({
-            'name': file_name,
-            'size': file_size,
-            'included': True  # All files in sync_files are included
-        })
+        parent_path, file_name = os.path.split(rel_path)
+        current = dir_rows.get(parent_path)
+        if current is None:
+            # Ensure parent directories exist, extending the path key one
+            # component at a time
+            current = 0
+            path_key = ''
+            for part in parent_path.split(os.sep):
+                path_key = path_key + os.sep + part if path_key else part
+
+                # Only create directory row if it doesn't exist yet
+                row = dir_rows.get(path_key)
+                if row is None:
+                    row = dir_rows[path_key] = len(dir_names)
+                    dir_names.append(sys.intern(part))
+                    dir_parents.append(current)
+                current = row
+
+        # Add the file row. Names such as __init__.py or index.ts recur across
+        # directories, and interning keeps one string per distinct name in the
+        # columns instead of one per file.
+        file_names.append(sys.intern(file_name))
+        file_row_sizes.append(file_size)
+        file_parents.append(current)
+
+    logger.debug(f"Tree built with {len(dir_rows) - 1} directories")
+
+    return {
+        'dirs': {
+            'names': dir_names,
+            'parents': dir_parents
+        },
+        'files': {
+            'names': file_names,
+            'sizes': file_row_sizes,
+            'parents': file_parents
+        }
+    }
 
-    logger.debug(f"Tree built with {len(dir_nodes)} directories")
+def iter_json_chunks(value, depth: int = 2):
+    """
+    Encode a value as compact JSON in pieces.
 
-    return root
+    Dicts are split into their members up to `depth` levels deep, iterators are
+    taken to yield JSON pieces and passed through, and every other value is
+    encoded in one C-accelerated encoder call. No piece holds the whole
+    document, and the encoder stays fast.
+    """
+    if isinstance(value, Iterator):
+        # Already encoded pieces, e.g. of a tree encoded while it is walked
+        yield from value
+    elif depth and isinstance(value, dict):
+        yield '{'
+        for index, (key, item) in enumerate(value.items()):
+            yield (',' if index else '') + json.dumps(str(key)) + ':'
+            yield from iter_json_chunks(item, depth - 1)
+        yield '}'
+    else:
+        yield COMPACT_JSON_ENCODER.encode(value)
 
 def get_project_root():
     """Get the project root directory."""
@@ -110,6 +182,12 @@ def get_project_root():
     logger.debug(f"Project root directory: {project_root}")
     return project_root
 
+@functools.lru_cache(maxsize=16)
+def _read_stripped_text(path: str, mtime_ns: int, size: int) -> str:
+    """Read a text file, stripped. Cached on (path, mtime, size) so unchanged files are read once."""
+    with open(path, 'r') as f:
+        return f.read().strip()
+
 def load_claudeignore_as_string(config):
     """Load .claudeignore content from local project directory."""
     local_path = config.get_local_path()
@@ -123,10 +201,10 @@ def load_claudeignore_as_string(config):
     logger.debug(f"Attempting to load .claudeignore from: {claudeignore_path}")
 
     try:
-        with open(claudeignore_path, 'r') as f:
-            content = f.read().strip()
-            logger.debug(f"Successfully loaded .claudeignore with content length: {len(content)}")
-            return content
+        st = os.stat(claudeignore_path)
+        content = _read_stripped_text(str(claudeignore_path), st.st_mtime_ns, st.st_size)
+        logger.debug(f"Successfully loaded .claudeignore with content length: {len(content)}")
+        return content
     except FileNotFoundError:
         logger.warning(f".claudeignore file not found at {claudeignore_path}")
         return ""
@@ -134,31 +212,262 @@ def load_claudeignore_as_string(config):
         logger.error(f"Error reading .claudeignore at {claudeignore_path}: {e}")
         return ""
 
+@functools.lru_cache(maxsize=16)
+def _real_base_dir(base_dir: str) -> str:
+    """Resolve a base directory once; it is the same project root on every request."""
+    return os.path.realpath(base_dir)
+
+def _file_stat_key(path: str):
+    """(mtime, size) of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+@functools.lru_cache(maxsize=4)
+def _build_ignore_matcher(project_root: str, stat_keys):
+    """Build the memoized ignore check for one version of the project's ignore files."""
+    gitignore = load_gitignore(project_root)
+    claudeignore = load_claudeignore(project_root)
+    # Both files in one spec, matched with a single regex search, unless one of
+    # them has negated patterns
+    combined = union_pathspec(gitignore, claudeignore)
+
+    @functools.lru_cache(maxsize=65536)
+    def is_ignored(rel_path: str) -> bool:
+        if combined is not None:
+            return combined.match_file(rel_path)
+        if gitignore and gitignore.match_file(rel_path):
+            return True
+        return bool(claudeignore and claudeignore.match_file(rel_path))
+
+    return is_ignored
+
+def ignore_matcher(project_root):
+    """
+    Get a check whether a relative path matches the project's .gitignore or .claudeignore.
+
+    Results are memoized per path for as long as both ignore files are unchanged,
+    so repeated folder listings and drops do not match the same paths again.
+    Directory paths are passed with a trailing slash.
+    """
+    project_root = str(project_root)
+    stat_keys = tuple(
+        _file_stat_key(os.path.join(project_root, name)) for name in ('.gitignore', '.claudeignore')
+    )
+    return _build_ignore_matcher(project_root, stat_keys)
+
+def _build_basename_index(project_root: str, is_ignored):
+    """
+    Walk the project once, collecting the relative paths of its files by name.
+
+    Returns:
+        tuple: The modification time of every directory walked, and each file
+        name to the relative paths, with forward slashes, of its files
+    """
+    def scan_directory(dir_info):
+        """List one directory, returning its mtime, subdirectories to walk and files."""
+        dir_path, rel_dir, order = dir_info
+        sub_dirs = []
+        files = []
+        # Taken before listing, so a change made meanwhile marks the index stale
+        mtime_ns = dir_mtime_ns(dir_path)
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            # Recorded as unreadable, so the next lookup walks it again
+            return dir_path, None, sub_dirs, files
+
+        for index, entry in enumerate(entries):
+            if entry.is_dir(follow_symlinks=False):
+                # Directories that are never synced, such as .git, are not walked,
+                # and ignored directories are pruned rather than walked file by file
+                if entry.name in EXCLUDED_DIRS:
+                    continue
+                sub_rel_dir = f"{rel_dir}{entry.name}/"
+                if not is_ignored(sub_rel_dir):
+                    sub_dirs.append((entry.path, sub_rel_dir, order + (1, index)))
+            elif entry.is_file():
+                # Skip files matching .gitignore or .claudeignore patterns
+                rel_path = rel_dir + entry.name
+                if not is_ignored(rel_path):
+                    files.append((order + (0, index), entry.name, rel_path))
+        return dir_path, mtime_ns, sub_dirs, files
+
+    # Walk with os.scandir, whose entries already know their type, and build
+    # the relative path from the parent's instead of calling relpath per file.
+    # Relative directory paths carry their trailing slash. The directories of
+    # each level are listed concurrently, as listing is syscall-bound and
+    # releases the GIL. Every entry carries its listing position along its
+    # path, files ahead of subdirectories, so sorting on it restores the
+    # order of a sequential walk.
+    dir_mtimes = {}
+    found = []
+    pending_dirs = [(project_root, '', ())]
+    with ThreadPoolExecutor(max_workers=WALK_WORKERS) as executor:
+        while pending_dirs:
+            if len(pending_dirs) > 1:
+                results = executor.map(scan_directory, pending_dirs)
+            else:
+                results = map(scan_directory, pending_dirs)
+            pending_dirs = []
+            for dir_path, mtime_ns, sub_dirs, files in results:
+                dir_mtimes[dir_path] = mtime_ns
+                pending_dirs.extend(sub_dirs)
+                found.extend(files)
+
+    paths_by_name = {}
+    for _, name, rel_path in sorted(found):
+        paths_by_name.setdefault(name, []).append(rel_path)
+    return dir_mtimes, paths_by_name
+
+# The last basename index built per project root, with what it was built from
+_BASENAME_INDEXES = {}
+_BASENAME_INDEX_LOCK = threading.Lock()
+
+def basename_index(project_root, is_ignored):
+    """
+    Get the relative paths of the project's non-ignored files by file name.
+
+    The index is kept across requests. A directory's modification time changes
+    whenever an entry is added to, removed from or renamed within it, so the
+    index is rebuilt only if one of the walked directories or the ignore check
+    changed. Checking that takes a stat per directory instead of a listing.
+    The result is shared and must not be modified.
+    """
+    project_root = str(project_root)
+    with _BASENAME_INDEX_LOCK:
+        cached = _BASENAME_INDEXES.get(project_root)
+        if cached and cached[0] is is_ignored and dir_mtimes_unchanged(cached[1]):
+            return cached[2]
+        dir_mtimes, paths_by_name = _build_basename_index(project_root, is_ignored)
+        _BASENAME_INDEXES[project_root] = (is_ignored, dir_mtimes, paths_by_name)
+        return paths_by_name
+
+def resolve_safe_path(base_dir: str, requested_path: str) -> Optional[str]:
+    """
+    Resolve the requested path against the base directory.
+
+    Returns the canonical path, or None if it lies outside the base directory.
+    """
+    try:
+        # Resolve any symlinks and normalize path. The requested path is resolved
+        # on every call, as a symlink below the base may be retargeted.
+        base_dir = _real_base_dir(str(base_dir))
+        resolved_path = os.path.realpath(os.path.join(base_dir, requested_path))
+
+        # Check if the resolved path is the base directory or lies below it
+        base_prefix = base_dir if base_dir.endswith(os.sep) else base_dir + os.sep
+        if resolved_path == base_dir or resolved_path.startswith(base_prefix):
+            return resolved_path
+        return None
+    except (ValueError, OSError):
+        # Handle any path manipulation errors
+        return None
+
 def is_safe_path(base_dir: str, requested_path: str) -> bool:
     """
     Safely verify that the requested path is within the base directory.
     """
+    return resolve_safe_path(base_dir, requested_path) is not None
+
+def _read_utf8_file_bytes(path: str) -> bytes:
+    """Read a file as bytes, checking that it is valid UTF-8."""
+    with open(path, 'rb') as f:
+        content = f.read()
+    content.decode('utf-8')
+    return content
+
+@functools.lru_cache(maxsize=64)
+def _read_cached_utf8_file_bytes(path: str, mtime_ns: int, size: int) -> bytes:
+    return _read_utf8_file_bytes(path)
+
+def read_text_file_bytes(path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Read a UTF-8 text file as bytes. Files up to FILE_CONTENT_CACHE_MAX_SIZE are
+    cached on (path, mtime, size), so repeated views of an unchanged file are served
+    from memory. Larger files are read on every call, so that viewing a few large
+    logs or dumps does not pin them in memory for the life of the server.
+
+    Raises:
+        UnicodeDecodeError: If the file is not valid UTF-8. Failures are not cached.
+    """
+    if size <= FILE_CONTENT_CACHE_MAX_SIZE:
+        return _read_cached_utf8_file_bytes(path, mtime_ns, size)
+    return _read_utf8_file_bytes(path)
+
+def atomic_write_text(path, content: str):
+    """
+    Write a text file atomically.
+
+    The content is written and fsynced to a temporary file next to the target, which
+    then replaces the target in one step. A crash mid-write leaves the previous file
+    intact instead of a truncated one.
+    """
+    path = Path(path)
+    # Unique per thread, as requests are served concurrently
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
     try:
-        # Resolve any symlinks and normalize path
-        base_dir = os.path.realpath(base_dir)
-        requested_path = os.path.realpath(os.path.join(base_dir, requested_path))
+        with open(tmp_path, 'w') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+def sync_data_etag(files_config, claudeignore: str, files_to_sync: Dict[str, str],
+                   file_sizes: Dict[str, int]) -> str:
+    """
+    Fingerprint the inputs of a sync-data response.
 
-        # Check if the resolved path starts with the base directory
-        common_prefix = os.path.commonpath([requested_path, base_dir])
-        return common_prefix == base_dir
-    except (ValueError, OSError):
-        # Handle any path manipulation errors
-        return False
+    The files to sync carry the hash of their content, so the fingerprint changes
+    whenever the response would, without building or encoding the tree.
+    """
+    fingerprint = hashlib.blake2b(digest_size=8)
+    fingerprint.update(json.dumps([files_config, claudeignore], sort_keys=True).encode())
+    for file_path, file_hash in files_to_sync.items():
+        fingerprint.update(f"\0{file_path}\0{file_hash}\0{file_sizes.get(file_path)}".encode())
+    return f'"{fingerprint.hexdigest()}"'
+
+# Suffix of the ETag of a gzip-compressed response body
+GZIP_ETAG_SUFFIX = '-gzip'
+
+def coded_etag(etag: str, compressed: bool) -> str:
+    """
+    The ETag of a response body as it is sent.
+
+    The gzip-compressed and the identity body are different representations,
+    so a strong tag must differ between them; the compressed one gets a suffix.
+    """
+    return f'{etag[:-1]}{GZIP_ETAG_SUFFIX}"' if compressed else etag
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Check whether an If-None-Match header lists etag.
+
+    The weak comparison of conditional GETs is used, so weak tags match too, as
+    do the tags of the same body in another coding.
+    """
+    def uncoded(tag):
+        tag = tag.strip().removeprefix('W/')
+        gzip_ending = f'{GZIP_ETAG_SUFFIX}"'
+        return tag[:-len(gzip_ending)] + '"' if tag.endswith(gzip_ending) else tag
 
-def format_size(size):
-    """Convert size in bytes to human readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size < 1024:
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} TB"
+    client_etags = {uncoded(tag) for tag in if_none_match.split(',')}
+    return uncoded(etag) in client_etags or '*' in client_etags
 
 class SyncDataHandler(http.server.SimpleHTTPRequestHandler):
+    timeout = REQUEST_TIMEOUT
+    # Set once a streamed response has sent its status line and headers, after
+    # which no other response may be written on the connection
+    response_started = False
+
     def __init__(self, *args, config=None, **kwargs):
         self.config = config
         super().__init__(*args, **kwargs)
@@ -207,14 +516,10 @@ class SyncDataHandler(http.server.SimpleHTTPRequestHandler):
                 self.project = project_path  # Update handler's project reference
 
                 # Send success response
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_cors_headers()
-                self.end_headers()
-                self.wfile.write(json.dumps({
+                self._send_json_response({
                     'success': True,
                     'message': f'Active project set to: {project_path}'
-                }).encode())
+                })
 
                 logger.debug(f"Successfully set active project to: {project_path}")
 
@@ -242,13 +547,15 @@ class SyncDataHandler(http.server.SimpleHTTPRequestHandler):
                 except json.JSONDecodeError as e:
                     return self._send_error_response(400, f"Invalid JSON in request body: {str(e)}")
 
-                return self._handle_incremental_config_update(data)
+                with CONFIG_UPDATE_LOCK:
+                    return self._handle_incremental_config_update(data)
             except Exception as e:
                 logger.error(f"Error processing update config request: {str(e)}\n{traceback.format_exc()}")
                 return self._send_error_response(500, f"Internal server error: {str(e)}")
 
         if parsed_path.path == '/api/replace-project-config':
-            return self._handle_full_config_replacement()
+            with CONFIG_UPDATE_LOCK:
+                return self._handle_full_config_replacement()
 
         if parsed_path.path == '/api/save-claudeignore':
             return self._handle_save_claudeignore()
@@ -359,22 +666,17 @@ class SyncDataHandler(http.server.SimpleHTTPRequestHandler):
             # Save updated config
             try:
                 project_config_path = self.config.config_dir / f"{active_project}.project.json"
-                with open(project_config_path, 'w') as f:
-                    json.dump(files_config, f, indent=2)
+                atomic_write_text(project_config_path, json.dumps(files_config, indent=2))
             except IOError as e:
                 logger.error(f"Failed to save project configuration: {str(e)}")
                 return self._send_error_response(500, f"Failed to save configuration: {str(e)}")
 
             # Send success response with updated config
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_cors_headers()
-            self.end_headers()
-            self.wfile.write(json.dumps({
+            self._send_json_response({
                 'success': True,
                 'message': message,
                 'config': files_config
-            }).encode())
+            })
 
         except Exception as e:
             logger.error(f"Error updating config: {str(e)}\n{traceback.format_exc()}")
@@ -420,18 +722,13 @@ class SyncDataHandler(http.server.SimpleHTTPRequestHandler):
                 project_config_path = self.config.config_dir / f"{active_project_path}.project.json"
 
                 # Write the updated configuration
-                with open(project_config_path, 'w') as f:
-                    f.write(content)
+                atomic_write_text(project_config_path, content)
 
                 # Send success response
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_cors_headers()
-                self.end_headers()
-                self.wfile.write(json.dumps({
+                self._send_json_response({
                     'success': True,
                     'message': 'Project configuration updated successfully'
-                }).encode())
+                })
 
                 logger.debug(f"Updated project configuration for {active_project_path}")
 
@@ -469,18 +766,13 @@ class SyncDataHandler(http.server.SimpleHTTPRequestHandler):
                 claudeignore_path = Path(project_root) / '.claudeignore'
 
                 # Write the updated .claudeignore
-                with open(claudeignore_path, 'w') as f:
-                    f.write(content)
+                atomic_write_text(claudeignore_path, content)
 
                 # Send success response
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_cors_headers()
-                self.end_headers()
-                self.wfile.write(json.dumps({
+                self._send_json_response({
                     'success': True,
                     'message': '.claudeignore updated successfully'
-                }).encode())
+                })
 
                 logger.debug(f"Updated .claudeignore at {claudeignore_path}")
 
@@ -493,14 +785,126 @@ class SyncDataHandler(http.server.SimpleHTTPRequestHandler):
 
     def _send_error_response(self, status_code: int, message: str):
         """Helper method to send error responses"""
+        self._send_json_response({
+            'success': False,
+            'error': message
+        }, status_code)
+
+    def _accepts_gzip(self) -> bool:
+        """Check whether the request's Accept-Encoding allows gzip."""
+        for coding in self.headers.get('Accept-Encoding', '').split(','):
+            name, _, params = coding.partition(';')
+            if name.strip().lower() == 'gzip':
+                return params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+        return False
+
+    def _send_not_modified(self, etag: str, compressed: bool) -> bool:
+        """
+        Answer a conditional GET with 304 Not Modified if the client already has etag.
+        compressed tells whether a full response would be gzip-compressed, which
+        decides the tag sent along.
+
+        Returns True if the response was sent.
+        """
+        if_none_match = self.headers.get('If-None-Match')
+        if not if_none_match or self.command != 'GET':
+            return False
+        if not etag_matches(if_none_match, etag):
+            return False
+        self.send_response(304)
+        self.send_header('ETag', coded_etag(etag, compressed))
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_cors_headers()
+        self.end_headers()
+        return True
+
+    def _send_json_response(self, data, status_code: int = 200):
+        """
+        Helper method to send a JSON response.
+
+        The body is encoded once, compactly, straight to bytes and sent with a
+        Content-Length header, so the client knows the size up front. Large
+        bodies (such as the sync-data tree) are gzip-compressed when the
+        client accepts it. Successful GET responses carry an ETag of the body,
+        so a client polling for unchanged data gets an empty 304 instead.
+        """
+        if self.response_started:
+            # A streamed response is already under way; its connection is closed
+            # once the handler returns
+            logger.error(f"Response to {self.path} already started, dropping status {status_code} response")
+            return
+        body = COMPACT_JSON_ENCODER.encode(data).encode()
+        compress = len(body) >= GZIP_MIN_SIZE and self._accepts_gzip()
+        etag = None
+        if status_code == 200 and self.command == 'GET':
+            etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+            if self._send_not_modified(etag, compress):
+                return
+        if compress:
+            body = gzip.compress(body, compresslevel=1)
         self.send_response(status_code)
         self.send_header('Content-type', 'application/json')
+        if compress:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Vary', 'Accept-Encoding')
+        if etag:
+            self.send_header('ETag', coded_etag(etag, compress))
+            self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Content-Length', str(len(body)))
         self.send_cors_headers()
         self.end_headers()
-        self.wfile.write(json.dumps({
-            'success': False,
-            'error': message
-        }).encode())
+        self.wfile.write(body)
+
+    def _send_json_stream(self, data, status_code: int = 200, etag: Optional[str] = None):
+        """
+        Send a large JSON response piece by piece while it is being encoded.
+
+        The socket starts draining before the whole document is encoded, and no
+        single buffer ever holds all of it. The body length is not known up
+        front, so the connection is closed to mark its end. The body is
+        gzip-compressed incrementally when the client accepts it. The caller
+        computes the ETag, if any, as the body is not known in advance.
+
+        The encoder yields many small pieces, and the socket writer is unbuffered,
+        so pieces are collected and written in blocks of STREAM_WRITE_SIZE rather
+        than with a send call each.
+
+        Errors while the body is encoded or written, such as a client disconnect,
+        are logged rather than raised. The headers are already out by then, so
+        the truncated response is ended by closing the connection instead.
+        """
+        compressor = zlib.compressobj(1, zlib.DEFLATED, 16 + zlib.MAX_WBITS) if self._accepts_gzip() else None
+        self.send_response(status_code)
+        self.send_header('Content-type', 'application/json')
+        if compressor:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Vary', 'Accept-Encoding')
+        if etag:
+            self.send_header('ETag', coded_etag(etag, compressor is not None))
+            self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.send_cors_headers()
+        self.end_headers()
+        self.close_connection = True
+        self.response_started = True
+
+        try:
+            pending = bytearray()
+            for chunk in iter_json_chunks(data):
+                chunk = chunk.encode()
+                if compressor:
+                    chunk = compressor.compress(chunk)
+                pending += chunk
+                if len(pending) >= STREAM_WRITE_SIZE:
+                    self.wfile.write(pending)
+                    pending.clear()
+            if compressor:
+                pending += compressor.flush()
+            if pending:
+                self.wfile.write(pending)
+        except Exception as e:
+            logger.error(f"Error streaming JSON response for {self.path}: {str(e)}\n{traceback.format_exc()}")
 
     def do_GET(self):
         parsed_path = urlparse(self.path)
@@ -531,13 +935,15 @@ class SyncDataHandler(http.server.SimpleHTTPRequestHandler):
                     self._send_error_response(403, "Access denied - path is outside project root")
                     return
 
-                # Check if folder exists
-                if not os.path.exists(full_path):
+                # Check if folder exists; one stat answers both existence and type
+                try:
+                    folder_mode = os.stat(full_path).st_mode
+                except OSError:
                     logger.warning(f"Folder does not exist: {full_path}")
                     self._send_error_response(404, "Folder not found")
                     return
                 
-                if not os.path.isdir(full_path):
+                if not stat.S_ISDIR(folder_mode):
                     logger.warning(f"Path exists but is not a directory: {full_path}")
                     self._send_error_response(400, "Path is not a directory")
                     return
@@ -547,7 +953,11 @@ class SyncDataHandler(http.server.SimpleHTTPRequestHandler):
                 active_project = self.get_active_project()
                 files_config = self.config.get_files_config(active_project)
                 logger.debug(f"Getting files to sync for project: {active_project}")
-                files_to_sync = get_local_files(self.config, project_root, files_config)
+                # Only the requested folder is traversed, not the whole project.
+                # The sizes it collects spare the walk below a stat per included file.
+                file_sizes = {}
+                files_to_sync = get_local_files(self.config, project_root, files_config, file_sizes,
+                                                subpath=folder_path)
 
                 # Handle timeout case
                 if files_to_sync is None:
@@ -557,23 +967,17 @@ class SyncDataHandler(http.server.SimpleHTTPRequestHandler):
 
                 logger.debug(f"Found {len(files_to_sync)} files to sync")
                 
-                # Get folder contents with inclusion status
-                logger.debug(f"Getting complete folder contents for {folder_path}")
-                folder_contents = self._get_complete_folder_contents(project_root, folder_path, files_to_sync)
-                logger.debug(f"Got folder contents with {len(folder_contents.get('children', []))} items")
-
-                # Prepare response
+                # Prepare response; the folder contents with their inclusion
+                # status are encoded while the folder is walked
                 response_data = {
                     'success': True,
-                    'contents': folder_contents
+                    'contents': self._iter_folder_contents_json(project_root, folder_path, files_to_sync,
+                                                                file_sizes,
+                                                                files_config.get('use_ignore_files', True))
                 }
                 logger.debug("Sending folder contents response")
                 
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_cors_headers()
-                self.end_headers()
-                self.wfile.write(json.dumps(response_data).encode())
+                self._send_json_stream(response_data)
                 logger.debug("Folder contents response sent successfully")
 
             except Exception as e:
@@ -595,30 +999,34 @@ class SyncDataHandler(http.server.SimpleHTTPRequestHandler):
                 # Get current config and project root
                 project_root = self.config.get_project_root()
 
-                # Validate the requested path is within project root for security
-                full_path = os.path.join(project_root, file_path)
-                if not is_safe_path(project_root, file_path):
+                # Validate the requested path is within project root for security.
+                # The canonical path is used from here on, so it is the one checked.
+                full_path = resolve_safe_path(project_root, file_path)
+                if full_path is None:
                     self._send_error_response(403, "Access denied - path is outside project root")
                     return
 
-                # Check if file exists
-                if not os.path.exists(full_path) or not os.path.isfile(full_path):
+                # A single stat checks existence and type and keys the content cache
+                try:
+                    st = os.stat(full_path)
+                except OSError:
+                    st = None
+                if st is None or not stat.S_ISREG(st.st_mode):
                     self._send_error_response(404, "File not found")
                     return
 
-                # Read and return file content
+                # Send the file bytes as is; they are only decoded to validate
+                # them as UTF-8, so the content is never JSON-escaped
                 try:
-                    with open(full_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                    content = read_text_file_bytes(full_path, st.st_mtime_ns, st.st_size)
 
                     self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
+                    self.send_header('Content-Type', 'text/plain; charset=utf-8')
+                    self.send_header('Content-Length', str(len(content)))
+                    self.send_header('X-File-Path', quote(file_path))
                     self.send_cors_headers()
                     self.end_headers()
-                    self.wfile.write(json.dumps({
-                        'content': content,
-                        'path': file_path
-                    }).encode())
+                    self.wfile.write(content)
 
                 except UnicodeDecodeError:
                     self._send_error_response(400, "File is not valid UTF-8 text")
@@ -627,27 +1035,27 @@ class SyncDataHandler(http.server.SimpleHTTPRequestHandler):
 
             except Exception as e:
                 logger.error(f"Error processing file content request: {str(e)}\n{traceback.format_exc()}")
-                self.wfile.write(json.dumps({'error': str(e)}).encode())
+                self._send_error_response(500, f"Internal server error: {str(e)}")
             return
 
         if parsed_path.path == '/api/sync-data':
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_cors_headers()
-            self.end_headers()
-
             try:
                 local_path = self.config.get_project_root()
                 active_project = self.get_active_project()
                 files_config = self.config.get_files_config(active_project)
 
-                # Get files that would be synced based on project configuration
-                files_to_sync = get_local_files(self.config, local_path, files_config)
+                # Get files that would be synced based on project configuration,
+                # keeping the sizes the traversal already knows for stats and tree
+                file_sizes = {}
+                files_to_sync = get_local_files(self.config, local_path, files_config, file_sizes)
+
+                # Shared by the timeout and the regular response
+                claudeignore = load_claudeignore_as_string(self.config)
 
                 # Handle timeout case
                 if files_to_sync is None:
                     timeout_response = {
-                        'claudeignore': load_claudeignore_as_string(self.config),
+                        'claudeignore': claudeignore,
                         'project': files_config,
                         'timeout': True,
                         'timeoutMessage': "File traversal exceeded 5-second time limit. Your project may have too many files to process.",
@@ -656,30 +1064,32 @@ class SyncDataHandler(http.server.SimpleHTTPRequestHandler):
                             'totalSize': 'Unknown'
                         }
                     }
-                    self.wfile.write(json.dumps(timeout_response).encode())
+                    self._send_json_response(timeout_response)
+                    return
+
+                # Unchanged files and configuration mean an unchanged response,
+                # so a polling client is answered before the tree is built
+                etag = sync_data_etag(files_config, claudeignore, files_to_sync, file_sizes)
+                # The streamed response is compressed whenever the client accepts it
+                if self._send_not_modified(etag, self._accepts_gzip()):
                     return
 
                 # Build response data for successful traversal
                 response_data = {
-                    'claudeignore': load_claudeignore_as_string(self.config),
+                    'claudeignore': claudeignore,
                     'project': files_config,
                     'timeout': False,
-                    'stats': self._get_stats(local_path, files_to_sync),
-                    'treemap': build_file_tree(local_path, files_to_sync, self.config, files_config)
+                    'stats': self._get_stats(local_path, files_to_sync, file_sizes),
+                    'treemap': build_file_tree(local_path, files_to_sync, file_sizes)
                 }
 
-                self.wfile.write(json.dumps(response_data).encode())
+                self._send_json_stream(response_data, etag=etag)
             except Exception as e:
                 logger.error(f"Error processing sync data request: {str(e)}\n{traceback.format_exc()}")
-                self.wfile.write(json.dumps({'error': str(e)}).encode())
+                self._send_json_response({'error': str(e)})
             return
 
         if parsed_path.path == '/api/projects':
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_cors_headers()
-            self.end_headers()
-
             try:
                 # Get all projects, including unlinked ones
                 projects = self.config.get_projects(include_unlinked=True)
@@ -697,32 +1107,37 @@ class SyncDataHandler(http.server.SimpleHTTPRequestHandler):
                     'activeProject': active_project_path
                 }
 
-                self.wfile.write(json.dumps(response).encode())
+                self._send_json_response(response)
             except Exception as e:
                 logger.error(f"Error getting projects: {str(e)}\n{traceback.format_exc()}")
-                self.wfile.write(json.dumps({'error': str(e)}).encode())
+                self._send_json_response({'error': str(e)})
             return
 
         # For all other paths, serve static files
         return super().do_GET()
 
-    def _get_stats(self, local_path, files_to_sync):
-        """Calculate sync statistics"""
+    def _get_stats(self, local_path, files_to_sync, file_sizes=None):
+        """Calculate sync statistics. Sizes come from file_sizes when given."""
         if files_to_sync is None:
             return {
                 "filesToSync": "Unknown",
                 "totalSize": "Unknown"
             }
 
+        file_sizes = file_sizes or {}
         total_size = 0
         total_files = 0
-
         for file_path in files_to_sync:
-            full_path = os.path.join(local_path, file_path)
-            if os.path.exists(full_path):
-                size = os.path.getsize(full_path)
-                total_size += size
-                total_files += 1
+            file_size = file_sizes.get(file_path)
+            if file_size is None:
+                # Only sizes the traversal did not collect cost a stat. Paths are
+                # relative to the project root, never to the server's working directory
+                try:
+                    file_size = os.stat(os.path.join(local_path, file_path)).st_size
+                except OSError:
+                    continue
+            total_size += file_size
+            total_files += 1
 
         return {
             "filesToSync": total_files,
@@ -730,18 +1145,18 @@ class SyncDataHandler(http.server.SimpleHTTPRequestHandler):
         }
 
     def _handle_push(self):
+        if not PUSH_LOCK.acquire(blocking=False):
+            return self._send_error_response(409, "A push is already in progress")
         try:
             push_files(self.config)
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_cors_headers()
-            self.end_headers()
-            self.wfile.write(json.dumps({
+            self._send_json_response({
                 'success': True,
                 'message': 'Files successfully pushed to Claude.ai'
-            }).encode())
+            })
         except Exception as e:
             self._send_error_response(500, str(e))
+        finally:
+            PUSH_LOCK.release()
 
     def _handle_resolve_dropped_files(self):
         """
@@ -773,14 +1188,10 @@ class SyncDataHandler(http.server.SimpleHTTPRequestHandler):
                 results = self._find_file_matches(project_root, files)
 
                 # Send success response
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_cors_headers()
-                self.end_headers()
-                self.wfile.write(json.dumps({
+                self._send_json_response({
                     'success': True,
                     'results': results
-                }).encode())
+                })
 
             except json.JSONDecodeError as e:
                 return self._send_error_response(400, f"Invalid JSON in request body: {str(e)}")
@@ -804,9 +1215,15 @@ class SyncDataHandler(http.server.SimpleHTTPRequestHandler):
         """
         results = []
 
-        # Load .gitignore and .claudeignore patterns
-        gitignore = load_gitignore(project_root)
-        claudeignore = load_claudeignore(project_root)
+        # Match against the .gitignore and .claudeignore patterns
+        is_ignored = ignore_matcher(project_root)
+
+        # All dropped names are looked up in a single walk of the project
+        wanted_names = {
+            name for name in (file_info.get('name', '') for file_info in files)
+            if name and isinstance(name, str)
+        }
+        matches_by_name = self._find_name_matches(project_root, wanted_names, is_ignored) if wanted_names else {}
 
         for file_info in files:
             name = file_info.get('name', '')
@@ -819,24 +1236,7 @@ class SyncDataHandler(http.server.SimpleHTTPRequestHandler):
                 })
                 continue
 
-            # Find all files with matching name
-            name_matches = []
-            for root, _, filenames in os.walk(project_root):
-                for filename in filenames:
-                    if filename == name:
-                        full_path = os.path.join(root, filename)
-                        # Get relative path and ensure forward slashes
-                        rel_path = os.path.relpath(full_path, project_root)
-                        rel_path = rel_path.replace('\\', '/')
-
-                        # Skip files matching .gitignore or .claudeignore patterns
-                        if gitignore and gitignore.match_file(rel_path):
-                            continue
-                        if claudeignore and claudeignore.match_file(rel_path):
-                            continue
-
-                        name_matches.append(rel_path)
-
+            name_matches = list(matches_by_name.get(name, ()))
             if name_matches:
                 results.append({
                     'originalName': name,
@@ -852,97 +1252,128 @@ class SyncDataHandler(http.server.SimpleHTTPRequestHandler):
 
         return results
 
-    def _get_complete_folder_contents(self, project_root, folder_path, files_to_sync):
+    def _find_name_matches(self, project_root, names, is_ignored):
+        """
+        Find all files below project_root whose name is in `names` and that are not ignored.
+
+        Returns:
+            dict: Each name found to the relative paths, with forward slashes, of its files
+        """
+        index = basename_index(project_root, is_ignored)
+        return {name: index[name] for name in names if name in index}
+
+    def _iter_folder_contents_json(self, project_root, folder_path, files_to_sync, file_sizes=None,
+                                   use_ignore_files=True):
         """
-        Get complete contents of a folder including both included and excluded files.
-        Recursively traverses all subfolders to build a complete tree.
-        
+        Walk a folder and yield the JSON of its complete contents piece by piece,
+        including both included and excluded files in all subfolders.
+
+        The tree is encoded as it is walked, depth first in listing order, so it is
+        never held in memory as a whole. Each directory is
+        {"name", "children", "included"}, each file {"name", "size", "included"},
+        and the folder itself {"name", "children"}.
+
         Args:
             project_root: Base directory of the project
             folder_path: Path to the folder relative to project root
             files_to_sync: Dictionary of files that would be synced
-            
-        Returns:
-            dict: Hierarchical structure of the folder with inclusion status for each item
+            file_sizes: Optional sizes of the files that would be synced, which are
+                        then not stat'ed again
+            use_ignore_files: Whether the project applies .gitignore and .claudeignore.
+                              If not, ignored directories may hold included files.
+
+        Yields:
+            str: Consecutive pieces of the JSON document
         """
         logger.debug(f"Getting complete folder contents for: {folder_path}")
-        
+
         # Determine appropriate folder name
         folder_name = os.path.basename(folder_path) or os.path.basename(project_root)
-        logger.debug(f"Using folder name: {folder_name}")
-        
-        result_tree = {
-            'name': folder_name,
-            'children': []
-        }
-        
+
         # Get the full path to the folder
         full_folder_path = os.path.join(project_root, folder_path)
         logger.debug(f"Full folder path: {full_folder_path}")
-        
-        # Create a recursive function to process directories
-        def process_directory(dir_path, rel_dir_path, parent_node):
+
+        # Ignored directories without included files are listed but not descended
+        # into, as nothing below them can be included. Without the ignore files
+        # every directory is descended into.
+        is_ignored_dir = ignore_matcher(project_root) if use_ignore_files else None
+
+        # Every directory containing an included file, at any depth, collected
+        # once instead of scanning all files for each listed directory
+        included_dirs = set()
+        for file_path in files_to_sync:
+            dir_path = file_path.replace(os.sep, '/').rpartition('/')[0]
+            while dir_path and dir_path not in included_dirs:
+                included_dirs.add(dir_path)
+                dir_path = dir_path.rpartition('/')[0]
+
+        def list_directory(dir_path, rel_dir_path):
+            # os.scandir yields the entry type with the listing, so no extra
+            # stat is needed to tell files from directories. Entries are kept in
+            # listing order; the frontend sorts files itself and lays out the
+            # treemap by size, so sorting each directory here bought nothing.
             try:
-                items = os.listdir(dir_path)
-                logger.debug(f"Found {len(items)} items in {rel_dir_path}")
-                
-                # Process all items in the directory
-                for item in sorted(items):
-                    item_path = os.path.join(dir_path, item)
-                    rel_path = os.path.relpath(item_path, project_root)
-                    rel_path = rel_path.replace('\\', '/')  # Normalize path separators
-                    
-                    # Skip hidden files starting with . on Unix systems
-                    if item.startswith('.') and item != '.':
-                        logger.debug(f"Skipping hidden item: {item}")
-                        continue
-                        
-                    if os.path.isdir(item_path):
-                        # Process directory
-                        logger.debug(f"Processing directory: {rel_path}")
-                        dir_node = {
-                            'name': item,
-                            'children': []
-                        }
-                        
-                        # Check if any files in this directory are included
-                        included_prefix = rel_path + '/'
-                        has_included_files = any(
-                            f.startswith(included_prefix) for f in files_to_sync.keys()
-                        )
-                        logger.debug(f"Directory {item} included status: {has_included_files}")
-                        
-                        dir_node['included'] = has_included_files
-                        parent_node['children'].append(dir_node)
-                        
-                        # Recursively process this directory
-                        process_directory(item_path, rel_path, dir_node)
-                    else:
-                        # Process file
-                        logger.debug(f"Processing file: {rel_path}")
-                        file_size = os.path.getsize(item_path)
-                        included = rel_path in files_to_sync
-                        logger.debug(f"File {item} size: {file_size}, included: {included}")
-                        
-                        file_node = {
-                            'name': item,
-                            'size': file_size,
-                            'included': included
-                        }
-                        parent_node['children'].append(file_node)
-            except Exception as e:
+                with os.scandir(dir_path) as it:
+                    return iter(list(it))
+            except OSError as e:
                 logger.error(f"Error processing directory {rel_dir_path}: {str(e)}")
-                logger.debug(traceback.format_exc())
-        
-        # Start recursive processing from the root folder
-        try:
-            process_directory(full_folder_path, folder_path, result_tree)
-            logger.debug(f"Completed folder traversal. Root has {len(result_tree['children'])} direct children")
-            return result_tree
-        except Exception as e:
-            logger.error(f"Error getting folder contents: {str(e)}")
-            logger.debug(traceback.format_exc())
-            raise
+                return iter(())
+
+        encode = COMPACT_JSON_ENCODER.encode
+
+        # Relative paths use forward slashes and no trailing slash, '' for the root
+        base_rel_path = os.path.relpath(full_folder_path, project_root).replace('\\', '/')
+        if base_rel_path == '.':
+            base_rel_path = ''
+
+        # Walk with an explicit stack of open directories rather than recursion,
+        # so deep trees do not hit the recursion limit. Each frame holds the
+        # remaining entries, the relative path, the text closing the directory
+        # and whether a child has been written yet.
+        yield '{"name":' + encode(folder_name) + ',"children":['
+        stack = [[list_directory(full_folder_path, base_rel_path), base_rel_path, ']}', False]]
+        while stack:
+            frame = stack[-1]
+            entries, rel_dir_path, closing, has_children = frame
+            entry = next(entries, None)
+            if entry is None:
+                stack.pop()
+                yield closing
+                continue
+
+            item = entry.name
+            # Skip hidden files and directories starting with . on Unix systems.
+            # Hidden directories are skipped as a whole and never descended into.
+            if item[0] == '.':
+                continue
+
+            # Extend the parent's relative path rather than re-deriving it
+            rel_path = f"{rel_dir_path}/{item}" if rel_dir_path else item
+            separator = ',' if has_children else ''
+
+            if entry.is_dir():
+                # Check if any files in this directory are included
+                has_included_files = rel_path in included_dirs
+                opening = f'{separator}{{"name":{encode(item)},"children":['
+                dir_closing = '],"included":' + ('true' if has_included_files else 'false') + '}'
+                if has_included_files or not is_ignored_dir or not is_ignored_dir(rel_path + '/'):
+                    yield opening
+                    stack.append([list_directory(entry.path, rel_path), rel_path, dir_closing, False])
+                else:
+                    yield opening + dir_closing
+            else:
+                is_included = rel_path in files_to_sync
+                file_size = file_sizes.get(rel_path) if is_included and file_sizes else None
+                if file_size is None:
+                    try:
+                        file_size = entry.stat().st_size
+                    except OSError as e:
+                        logger.error(f"Error reading {rel_path}: {str(e)}")
+                        continue
+                included = 'true' if is_included else 'false'
+                yield f'{separator}{{"name":{encode(item)},"size":{file_size},"included":{included}}}'
+            frame[3] = True
 
 @click.command()
 @click.option('--port', default=4201, help='Port to run the server on')
@@ -974,14 +1405,53 @@ def simulate_push(config, port, no_browser):
         click.echo(f"Error: Web directory not found at {web_dir}")
         return
 
-    os.chdir(web_dir)
-
     class LocalhostTCPServer(socketserver.TCPServer):
-        def server_bind(self):
-            self.socket.setsockopt(socketserver.socket.SOL_SOCKET, socketserver.socket.SO_REUSEADDR, 1)
-            self.socket.bind(('127.0.0.1', self.server_address[1]))
+        # Requests are served on a bounded thread pool, so a slow /api/sync-data
+        # traversal does not hold up static files or the other API endpoints,
+        # and bursts of parallel requests do not spawn a thread each
+        allow_reuse_address = True
+        # Connections wait in the listen backlog while all workers are busy;
+        # the default of 5 makes a browser's burst of parallel requests retry
+        request_queue_size = 64
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            # Daemon workers, unlike ThreadPoolExecutor's, do not keep the process
+            # alive on Ctrl+C while one is blocked reading an idle connection
+            self.pending_requests = queue.Queue()
+            self.workers = [
+                threading.Thread(target=self.serve_pending_requests, name=f'simulate-http-{index}', daemon=True)
+                for index in range(SERVER_WORKERS)
+            ]
+            for worker in self.workers:
+                worker.start()
+
+        def serve_pending_requests(self):
+            while True:
+                pending = self.pending_requests.get()
+                if pending is None:
+                    return
+                self.process_request_thread(*pending)
 
-    handler = lambda *args: SyncDataHandler(*args, config=config)
+        def process_request(self, request, client_address):
+            self.pending_requests.put((request, client_address))
+
+        def process_request_thread(self, request, client_address):
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+        def server_close(self):
+            super().server_close()
+            for _ in self.workers:
+                self.pending_requests.put(None)
+
+    # Serve the static files from web_dir without changing the process working
+    # directory, so relative project paths keep resolving against the project
+    handler = lambda *args: SyncDataHandler(*args, config=config, directory=web_dir)
 
     try:
         with LocalhostTCPServer(("127.0.0.1", port), handler) as httpd:
@@ -1,5 +1,6 @@
 import click
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Tuple, Dict
 
@@ -46,23 +47,35 @@ def push_files(
     files_config = config.get_files_config(project)
     project_root = config.get_project_root()
 
-    provider = validate_and_get_provider(config)
-
-    # Use project configuration
+    # Use project configuration. Resolved before the provider so that a missing
+    # project fails without decrypting the session key.
     active_organization_id = config.get("active_organization_id")
     project_id = config.get_project_id(project)
 
-    # Get files to sync using patterns from files configuration
-    local_files = get_local_files(config, project_root, files_config)
+    # A simulated push never talks to the remote side
+    provider = None if simulate else validate_and_get_provider(config)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Fetch the remote file list while the local files are traversed and hashed
+        remote_files_future = None
+        if not simulate:
+            remote_files_future = executor.submit(
+                provider.list_files, active_organization_id, project_id
+            )
+
+        # Get files to sync using patterns from files configuration
+        local_files = get_local_files(config, project_root, files_config)
 
     # Check if file traversal timed out
     if local_files is None:
         error_msg = "File traversal exceeded time limit (5s). Your project may have too many files to process."
-        click.echo(f"Error: {error_msg}")
-        click.echo("Consider narrowing your project scope by:")
-        click.echo("  - Adjusting includes/excludes patterns")
-        click.echo("  - Using push_roots to limit directories")
-        click.echo("  - Adding more patterns to .claudeignore")
+        click.echo("\n".join([
+            f"Error: {error_msg}",
+            "Consider narrowing your project scope by:",
+            "  - Adjusting includes/excludes patterns",
+            "  - Using push_roots to limit directories",
+            "  - Adding more patterns to .claudeignore",
+        ]))
         raise RuntimeError(error_msg)
 
     # Set as active project
@@ -70,7 +83,7 @@ def push_files(
 
     if not simulate:
         # Sync files
-        remote_files = provider.list_files(active_organization_id, project_id)
+        remote_files = remote_files_future.result()
         sync_manager = SyncManager(provider, config, project_id, project_root)
         sync_manager.sync(local_files, remote_files)
         click.echo(f"Project '{project}' synced successfully")
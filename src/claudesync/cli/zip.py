@@ -7,7 +7,7 @@ import click
 from pathlib import Path
 
 from ..exceptions import ConfigurationError
-from ..utils import get_local_files, handle_errors
+from ..utils import get_local_files, handle_errors, format_size
 
 @click.command()
 @click.argument("project", required=False)
@@ -78,16 +78,8 @@ def zip(config, project, output):
                     zipf.write(full_path, rel_path)
 
     total_size = os.path.getsize(output)
-    size_str = _format_size(total_size)
+    size_str = format_size(total_size)
 
     click.echo(f"\nCreated ZIP file: {output}")
     click.echo(f"Total files: {len(local_files)}")
     click.echo(f"Total size: {size_str}")
-
-def _format_size(size):
-    """Convert size in bytes to human readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size < 1024:
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} TB"
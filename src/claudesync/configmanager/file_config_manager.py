@@ -1,3 +1,5 @@
+import copy
+import functools
 import json
 import os
 from datetime import datetime
@@ -7,6 +9,38 @@ import logging
 from claudesync.configmanager.base_config_manager import BaseConfigManager
 from claudesync.exceptions import ConfigurationError
 from claudesync.session_key_manager import SessionKeyManager
+from claudesync.utils import dir_mtime_ns, dir_mtimes_unchanged
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_json_file(path, mtime_ns, size, inode, ctime_ns):
+    """
+    Parse a JSON file. Cached on its path and stat key so unchanged files are parsed once.
+
+    The inode and ctime are part of the key because the small state files are often
+    rewritten with content of the same length, e.g. another project UUID, which within
+    the file system's mtime granularity leaves mtime and size unchanged.
+    """
+    return json.loads(Path(path).read_bytes())
+
+
+def _read_json_file(path):
+    """
+    Load a JSON file through the parse cache without copying it.
+
+    The result is shared with the cache and must not be modified.
+    """
+    st = os.stat(path)
+    return _parse_json_file(str(path), st.st_mtime_ns, st.st_size, st.st_ino, st.st_ctime_ns)
+
+
+def _load_json_file(path):
+    """
+    Load a JSON file through the parse cache.
+
+    Returns a deep copy, so callers may modify the result without affecting the cache.
+    """
+    return copy.deepcopy(_read_json_file(path))
 
 
 class FileConfigManager(BaseConfigManager):
@@ -33,6 +67,8 @@ class FileConfigManager(BaseConfigManager):
             self.config_dir = Path(config_dir)
         else:
             self.config_dir = self._find_config_dir()
+        # Last scan of the project files in config_dir, see _scan_project_files
+        self._project_scan = None
 
     def get_projects(self, include_unlinked=False):
         """
@@ -51,35 +87,77 @@ class FileConfigManager(BaseConfigManager):
         if not self.config_dir:
             raise ConfigurationError("No .claudesync directory found")
 
+        # The layout of .claudesync only changes when files are added, removed or
+        # renamed, which changes the modification time of their directory, so an
+        # earlier scan is reused while no directory has changed. The project IDs
+        # are read on every call, through the parse cache.
+        scan = self._project_scan
+        if scan is None or not dir_mtimes_unchanged(scan[0]):
+            scan = self._project_scan = self._scan_project_files()
+
         projects = {}
+        for project_path, project_id_file in scan[1]:
+            project_id = ''
+            if project_id_file:
+                try:
+                    project_data = _read_json_file(project_id_file)
+                    project_id = project_data.get('project_id')
+                except (json.JSONDecodeError, IOError) as e:
+                    logging.warning(f"Failed to load project file {project_id_file}: {str(e)}")
+                    continue
+
+            projects[project_path] = project_id
+        return projects
+
+    def _scan_project_files(self):
+        """
+        Find the project configurations in the .claudesync directory.
 
-        # Walk through the .claudesync directory
-        for root, _, files in os.walk(self.config_dir):
-            for file in files:
-                if file.endswith('.project.json'):
+        Returns:
+            tuple: The modification time of each directory scanned, and a list of
+            (project_path, project_id_file) pairs, where project_id_file is the path
+            of the project's .project_id.json or None if it has none
+        """
+        dir_mtimes = {}
+        project_files = []
+
+        # Walk through the .claudesync directory with os.scandir, pairing each
+        # .project.json with its .project_id.json from the same directory listing
+        pending_dirs = [(str(self.config_dir), '')]
+        while pending_dirs:
+            dir_path, rel_root = pending_dirs.pop()
+            # Taken before listing, so a change made meanwhile invalidates the scan
+            dir_mtimes[dir_path] = dir_mtime_ns(dir_path)
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except OSError:
+                # Listed again on the next call, as permissions may change without the mtime
+                dir_mtimes[dir_path] = None
+                continue
+
+            file_names = set()
+            sub_dirs = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # Handle nested projects by tracking the path relative to .claudesync
+                    sub_dirs.append((entry.path, os.path.join(rel_root, entry.name) if rel_root else entry.name))
+                else:
+                    file_names.add(entry.name)
+            # Visit subdirectories in listing order
+            pending_dirs.extend(reversed(sub_dirs))
+
+            for entry in entries:
+                file = entry.name
+                if file.endswith('.project.json') and file in file_names:
                     # Extract project path from filename
-                    project_path = file[:-len('.project.json')]
-
-                    project_id_file = os.path.join(root, project_path + '.project_id.json')
-                    project_id = ''
-
-                    # Handle nested projects by getting relative path from .claudesync dir
-                    rel_root = os.path.relpath(root, self.config_dir)
-                    if rel_root != '.':
-                        project_path = os.path.join(rel_root, project_path)
-
-                    if os.path.exists(project_id_file):
-                        # Load project ID from file
-                        try:
-                            with open(project_id_file) as f:
-                                project_data = json.load(f)
-                                project_id = project_data.get('project_id')
-                        except (json.JSONDecodeError, IOError) as e:
-                            logging.warning(f"Failed to load project file {file}: {str(e)}")
-                            continue
-
-                    projects[project_path] = project_id
-        return projects
+                    project_name = file[:-len('.project.json')]
+                    project_path = os.path.join(rel_root, project_name) if rel_root else project_name
+
+                    project_id_name = project_name + '.project_id.json'
+                    project_id_file = os.path.join(dir_path, project_id_name) if project_id_name in file_names else None
+                    project_files.append((project_path, project_id_file))
+        return dir_mtimes, project_files
 
     def get_active_project(self):
         """
@@ -92,13 +170,10 @@ class FileConfigManager(BaseConfigManager):
             return None, None
 
         active_project_file = self.config_dir / "active_project.json"
-        if not active_project_file.exists():
-            return None, None
-
         try:
-            with open(active_project_file) as f:
-                data = json.load(f)
-                return data.get("project_path"), data.get("project_id")
+            # Only string fields are read, so the cached data needs no copy
+            data = _read_json_file(active_project_file)
+            return data.get("project_path"), data.get("project_id")
         except (json.JSONDecodeError, IOError):
             return None, None
 
@@ -120,8 +195,11 @@ class FileConfigManager(BaseConfigManager):
             "project_id": project_id
         }
 
-        with open(active_project_file, "w") as f:
-            json.dump(data, f, indent=2)
+        # Machine-generated and never hand-edited, so written compactly
+        active_project_file.write_text(json.dumps(data))
+        # The file is rewritten in place, possibly within the mtime granularity of
+        # an earlier write, and project ID files may just have been rewritten too
+        _parse_json_file.cache_clear()
 
     def _find_config_dir(self):
         current_dir = Path.cwd()
@@ -142,35 +220,25 @@ class FileConfigManager(BaseConfigManager):
         if not self.config_dir:
             raise ConfigurationError("No .claudesync directory found")
 
+        # Nested project paths like 'datamodel/typeconstraints' resolve to subdirectories
         project_file = self.config_dir / f"{project_path}.project_id.json"
-        if not project_file.exists():
-            # Try with subdirectories
-            parts = project_path.split('/')
-            project_file = self.config_dir / '/'.join(parts[:-1]) / f"{parts[-1]}.project_id.json"
-
-        if not project_file.exists():
+        try:
+            return _read_json_file(project_file)['project_id']
+        except FileNotFoundError:
             raise ConfigurationError(f"Project configuration not found for {project_path}")
 
-        with open(project_file) as f:
-            return json.load(f)['project_id']
-
     def get_files_config(self, project_path):
         """Get files configuration from files-specific JSON file."""
         if not self.config_dir:
             raise ConfigurationError("No .claudesync directory found")
 
+        # Nested project paths like 'datamodel/typeconstraints' resolve to subdirectories
         files_file = self.config_dir / f"{project_path}.project.json"
-        if not files_file.exists():
-            # Try with subdirectories
-            parts = project_path.split('/')
-            files_file = self.config_dir / '/'.join(parts[:-1]) / f"{parts[-1]}.project.json"
-
-        if not files_file.exists():
+        try:
+            return _load_json_file(files_file)
+        except FileNotFoundError:
             raise ConfigurationError(f"Files configuration not found for {project_path}")
 
-        with open(files_file) as f:
-            return json.load(f)
-
     def get_project_root(self):
         """Get the root directory containing .claudesync."""
         return self.config_dir.parent if self.config_dir else None
@@ -192,11 +260,8 @@ class FileConfigManager(BaseConfigManager):
 
         with open(self.global_config_file, "r") as f:
             config = json.load(f)
-            defaults = self._get_default_config()
-            for key, value in defaults.items():
-                if key not in config:
-                    config[key] = value
-            return config
+            # Values from the file override the defaults
+            return {**self._get_default_config(), **config}
 
     def get_local_path(self):
         """
@@ -1,4 +1,3 @@
-import subprocess
 import base64
 import logging
 from pathlib import Path
@@ -27,6 +26,8 @@ class SessionKeyManager:
         return input("Enter the full path to your new Ed25519 private key: ")
 
     def _get_key_type(self):
+        import subprocess
+
         try:
             result = subprocess.run(
                 ["ssh-keygen", "-l", "-f", self.ssh_key_path],
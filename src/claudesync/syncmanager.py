@@ -66,11 +66,14 @@ class SyncManager:
         remote_files_to_delete = set(rf["file_name"] for rf in remote_files)
         synced_files = set()
 
+        # Index remote files by name once instead of scanning the list per local file
+        remote_files_by_name = {}
+        for rf in remote_files:
+            remote_files_by_name.setdefault(rf["file_name"], rf)
+
         with tqdm(total=len(local_files), desc="Local → Remote") as pbar:
             for local_file, local_checksum in local_files.items():
-                remote_file = next(
-                    (rf for rf in remote_files if rf["file_name"] == local_file), None
-                )
+                remote_file = remote_files_by_name.get(local_file)
                 if remote_file:
                     self.update_existing_file(
                         local_file,
@@ -202,7 +205,7 @@ class SyncManager:
         remote_content = remote_file["content"]
         remote_checksum = compute_md5_hash(remote_content)
         if local_checksum != remote_checksum:
-            logger.debug(f"Updating {local_file} on remote...")
+            logger.debug("Updating %s on remote...", local_file)
             with tqdm(total=2, desc=f"Updating {local_file}", leave=False) as pbar:
                 self.provider.delete_file(
                     self.active_organization_id,
@@ -227,7 +230,7 @@ class SyncManager:
 
     @retry_on_403()
     def upload_new_file(self, local_file, synced_files):
-        logger.debug(f"Uploading new file {local_file} to remote...")
+        logger.debug("Uploading new file %s to remote...", local_file)
         with open(
             os.path.join(self.local_path, local_file), "r", encoding="utf-8"
         ) as file:
@@ -251,7 +254,7 @@ class SyncManager:
                         remote_file["created_at"].replace("Z", "+00:00")
                     ).timestamp()
                     os.utime(local_file_path, (remote_timestamp, remote_timestamp))
-                    logger.debug(f"Updated timestamp on local file {local_file_path}")
+                    logger.debug("Updated timestamp on local file %s", local_file_path)
 
     def sync_remote_to_local(self, remote_file, remote_files_to_delete, synced_files):
         local_file_path = os.path.join(self.local_path, remote_file["file_name"])
@@ -274,9 +277,7 @@ class SyncManager:
             remote_file["created_at"].replace("Z", "+00:00")
         )
         if remote_mtime > local_mtime:
-            logger.debug(
-                f"Updating local file {remote_file['file_name']} from remote..."
-            )
+            logger.debug("Updating local file %s from remote...", remote_file["file_name"])
             content = remote_file["content"]
             with open(local_file_path, "w", encoding="utf-8") as file:
                 file.write(content)
@@ -287,9 +288,7 @@ class SyncManager:
     def create_new_local_file(
         self, local_file_path, remote_file, remote_files_to_delete, synced_files
     ):
-        logger.debug(
-            f"Creating new local file {remote_file['file_name']} from remote..."
-        )
+        logger.debug("Creating new local file %s from remote...", remote_file["file_name"])
         content = remote_file["content"]
         with tqdm(
             total=1, desc=f"Creating {remote_file['file_name']}", leave=False
@@ -311,7 +310,7 @@ class SyncManager:
 
     @retry_on_403()
     def delete_remote_files(self, file_to_delete, remote_files):
-        logger.debug(f"Deleting {file_to_delete} from remote...")
+        logger.debug("Deleting %s from remote...", file_to_delete)
         remote_file = next(
             rf for rf in remote_files if rf["file_name"] == file_to_delete
         )
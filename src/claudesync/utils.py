@@ -1,7 +1,9 @@
 import os
 import hashlib
+import re
 import time as time_module
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
 from pathlib import Path
 
 import click
@@ -9,7 +11,6 @@ import pathspec
 import logging
 
 from claudesync.exceptions import ConfigurationError, ProviderError
-from claudesync.provider_factory import get_provider
 
 logger = logging.getLogger(__name__)
 
@@ -48,11 +49,211 @@ def load_gitignore(base_path):
         pathspec.PathSpec or None: A PathSpec object containing the patterns from the .gitignore file
                                     if the file exists; otherwise, None.
     """
-    gitignore_path = os.path.join(base_path, ".gitignore")
-    if os.path.exists(gitignore_path):
-        with open(gitignore_path, "r") as f:
-            return pathspec.PathSpec.from_lines("gitwildmatch", f)
-    return None
+    return load_ignore_file(os.path.join(base_path, ".gitignore"))
+
+
+@lru_cache(maxsize=32)
+def _compile_ignore_file(path, mtime_ns, size):
+    """Read and compile an ignore file. Cached on (path, mtime, size) so unchanged files are read once."""
+    with open(path, "r") as f:
+        return compile_pathspec(tuple(f.read().splitlines()))
+
+
+def load_ignore_file(path):
+    """
+    Loads an ignore file such as .gitignore or .claudeignore as a PathSpec.
+
+    The file is only stat'ed while it is unchanged, so callers may load it on every
+    request.
+
+    Args:
+        path (str): The path of the ignore file.
+
+    Returns:
+        pathspec.PathSpec or None: The compiled patterns, or None if the file does not exist.
+    """
+    try:
+        st = os.stat(path)
+        return _compile_ignore_file(path, st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        return None
+
+
+def dir_mtime_ns(dir_path):
+    """The modification time of a directory in nanoseconds, or None if it cannot be stat'ed."""
+    try:
+        return os.stat(dir_path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def dir_mtimes_unchanged(dir_mtimes):
+    """
+    Checks whether directories are unchanged since they were listed.
+
+    A directory's modification time changes whenever an entry is added to, removed
+    from or renamed within it, so data derived from the listings can be reused
+    while this returns True.
+
+    Args:
+        dir_mtimes (dict): Each directory path to its dir_mtime_ns when it was listed.
+                           None marks a directory that could not be stat'ed then.
+
+    Returns:
+        bool: True if every directory still has the recorded modification time.
+    """
+    return all(dir_mtime_ns(dir_path) == mtime_ns for dir_path, mtime_ns in dir_mtimes.items())
+
+
+@lru_cache(maxsize=64)
+def compile_pathspec(patterns):
+    """
+    Compiles a tuple of gitwildmatch patterns into a PathSpec object.
+
+    Compiled specs are cached by their patterns, so callers that evaluate the same
+    project configuration repeatedly (e.g. the simulate server on every request)
+    only pay the regex compilation cost once.
+
+    Args:
+        patterns (tuple): The patterns to compile. Must be hashable.
+
+    Returns:
+        pathspec.PathSpec: The compiled PathSpec object.
+    """
+    spec = pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+    combined_patterns = combine_pattern_regexes(spec.patterns)
+    if combined_patterns is not None:
+        # One regex search per run of patterns instead of one per pattern
+        return pathspec.PathSpec(combined_patterns)
+    return spec
+
+
+# Named groups in the regexes generated by pathspec, e.g. its directory marker.
+# Their names would clash once several regexes are joined into one.
+_NAMED_GROUP_RE = re.compile(r"\(\?P<\w+>")
+
+
+def combine_pattern_regexes(compiled_patterns):
+    """
+    Joins runs of compiled gitwildmatch patterns into single alternation regexes.
+
+    The last pattern matching a path decides whether it is included. Within a run
+    of consecutive patterns that are all negated or all not negated, it does not
+    matter which one matched last, so each run is replaced by one alternation of
+    its regexes. A path is then matched with one regex search per run instead of
+    one per pattern, and negated patterns keep their meaning.
+
+    Args:
+        compiled_patterns (list): The pathspec.RegexPattern objects to combine.
+
+    Returns:
+        list or None: The combined pathspec.RegexPattern objects in their original
+                      order, or None if combining would not reduce their number.
+    """
+    runs = []
+    for pattern in compiled_patterns:
+        if pattern.include is None:
+            # Blank lines and comments
+            continue
+        regex = _NAMED_GROUP_RE.sub("(?:", pattern.regex.pattern)
+        if runs and runs[-1][0] == pattern.include:
+            runs[-1][1].append(regex)
+        else:
+            runs.append((pattern.include, [regex]))
+    if len(runs) == sum(len(regexes) for _, regexes in runs):
+        return None
+    return [
+        pathspec.RegexPattern(re.compile("|".join(f"(?:{regex})" for regex in regexes)), include=include)
+        for include, regexes in runs
+    ]
+
+
+def union_pathspec(*specs):
+    """
+    Joins PathSpecs into one that matches a path exactly when any of them does.
+
+    Without negated patterns a spec matches a path when any one of its patterns
+    does, so the patterns of all specs can be joined into a single alternation,
+    e.g. to match .gitignore and .claudeignore with one regex search per path.
+    A negated pattern only applies within its own spec, so None is returned if
+    any spec has one and the caller keeps matching the specs separately.
+
+    Args:
+        *specs: The pathspec.PathSpec objects to join. None entries are skipped.
+
+    Returns:
+        pathspec.PathSpec or None: The joined PathSpec, or None if the specs cannot
+                                   be joined.
+    """
+    patterns = [
+        pattern for spec in specs if spec is not None
+        for pattern in spec.patterns if pattern.include is not None
+    ]
+    if not all(pattern.include for pattern in patterns):
+        return None
+    combined_patterns = combine_pattern_regexes(patterns)
+    return pathspec.PathSpec(combined_patterns if combined_patterns is not None else patterns)
+
+
+@lru_cache(maxsize=64)
+def literal_pattern_index(patterns):
+    """
+    Collects the wildcard-free patterns from a tuple of gitwildmatch patterns.
+
+    A path equal to one of the returned literal paths, or starting with one of the
+    returned directory prefixes, is matched by the patterns without running the
+    PathSpec regexes. Any other path still has to be checked against the PathSpec.
+    Negated patterns can undo an earlier match, so if any are present the index
+    is empty and every path goes through the PathSpec.
+
+    Args:
+        patterns (tuple): The patterns to index. Must be hashable.
+
+    Returns:
+        tuple: A frozenset of literal paths and a tuple of directory prefixes.
+    """
+    literal_paths = set()
+    literal_prefixes = []
+    for pattern in patterns:
+        pattern = pattern.strip()
+        if not pattern or pattern.startswith("#"):
+            continue
+        if pattern.startswith("!"):
+            return frozenset(), ()
+        if any(c in pattern for c in "*?[\\"):
+            continue
+        pattern = pattern.lstrip("/")
+        if not pattern:
+            continue
+        if pattern.endswith("/"):
+            literal_prefixes.append(pattern)
+        else:
+            # A literal also matches everything below a directory of that name
+            literal_paths.add(pattern)
+            literal_prefixes.append(pattern + "/")
+    return frozenset(literal_paths), tuple(literal_prefixes)
+
+
+def match_includes(spec, literal_index, rel_paths):
+    """
+    Yields the paths from rel_paths matched by the include patterns.
+
+    Paths covered by the literal index of the patterns are yielded directly, the
+    rest are matched against the compiled PathSpec in a single call.
+    """
+    literal_paths, literal_prefixes = literal_index
+    if not literal_paths and not literal_prefixes:
+        yield from spec.match_files(rel_paths)
+        return
+
+    pending = []
+    for rel_path in rel_paths:
+        posix_path = rel_path.replace(os.sep, "/")
+        if posix_path in literal_paths or posix_path.startswith(literal_prefixes):
+            yield rel_path
+        else:
+            pending.append(rel_path)
+    yield from spec.match_files(pending)
 
 
 def is_text_file(file_path, sample_size=8192):
@@ -95,50 +296,79 @@ def compute_md5_hash(content):
     return hashlib.md5(content.encode("utf-8")).hexdigest()
 
 
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def format_size(size):
+    """Convert size in bytes to human readable format."""
+    # Each unit is 2**10 times the previous one, so the bit length picks the unit
+    unit_index = min((int(size).bit_length() - 1) // 10, len(SIZE_UNITS) - 1) if size >= 1 else 0
+    return f"{size / (1 << (10 * unit_index)):.1f} {SIZE_UNITS[unit_index]}"
+
+
 def should_process_file(
-        config_manager, file_path, filename, gitignore, base_path, claudeignore, category_excludes=None
+        config_manager, file_path, filename, gitignore, base_path, claudeignore, category_excludes=None,
+        file_sizes=None, check_text=True, file_stats=None, rel_path=None
 ):
     """
     Determines whether a file should be processed based on various criteria.
+
+    If file_sizes is given, the size of a file that passes the size check is stored
+    in it under the file's relative path, so callers need not stat it again.
+    file_stats likewise receives the file's whole os.stat result.
+
+    With check_text=False the final text file check is left to the caller, e.g.
+    because it reads the file anyway. Callers that already know the file's path
+    relative to base_path pass it as rel_path.
     """
     # Check if ignore files should be used
     use_ignore_files = config_manager.get("use_ignore_files", True)
 
     # Get relative path for pattern matching
-    rel_path = os.path.relpath(file_path, base_path)
-
-    # Check file size
-    max_file_size = config_manager.get("max_file_size", 32 * 1024)
-    if os.path.getsize(file_path) > max_file_size:
-        logger.debug(f"File {rel_path} exceeds max size of {max_file_size} bytes")
-        return False
+    if rel_path is None:
+        rel_path = os.path.relpath(file_path, base_path)
 
     # Skip temporary editor files
     if filename.endswith("~"):
-        logger.debug(f"Skipping temporary file {rel_path}")
+        logger.debug("Skipping temporary file %s", rel_path)
         return False
 
     # Apply ignore patterns if enabled
     if use_ignore_files:
         # Use gitignore rules if available
         if gitignore and gitignore.match_file(rel_path):
-            logger.debug(f"File {rel_path} matches gitignore pattern")
+            logger.debug("File %s matches gitignore pattern", rel_path)
             return False
 
         # Use .claudeignore rules if available
         if claudeignore and claudeignore.match_file(rel_path):
-            logger.debug(f"File {rel_path} matches claudeignore pattern")
+            logger.debug("File %s matches claudeignore pattern", rel_path)
             return False
 
     # Check category-specific exclusions
     if category_excludes and category_excludes.match_file(rel_path):
-        logger.debug(f"File {rel_path} excluded by category exclusion patterns")
+        logger.debug("File %s excluded by category exclusion patterns", rel_path)
+        return False
+
+    # Check file size only once the pattern checks pass, as it costs a stat call
+    max_file_size = config_manager.get("max_file_size", 32 * 1024)
+    file_stat = os.stat(file_path)
+    file_size = file_stat.st_size
+    if file_size > max_file_size:
+        logger.debug("File %s exceeds max size of %s bytes", rel_path, max_file_size)
         return False
+    if file_sizes is not None:
+        file_sizes[rel_path] = file_size
+    if file_stats is not None:
+        file_stats[rel_path] = file_stat
+
+    if not check_text:
+        return True
 
     # Finally check if it's a text file
     is_text = is_text_file(file_path)
     if not is_text:
-        logger.debug(f"File {rel_path} is not a text file")
+        logger.debug("File %s is not a text file", rel_path)
     return is_text
 
 
@@ -161,12 +391,56 @@ def process_file(file_path):
             content = file.read()
             return compute_md5_hash(content)
     except UnicodeDecodeError:
-        logger.debug(f"Unable to read {file_path} as UTF-8 text. Skipping.")
+        logger.debug("Unable to read %s as UTF-8 text. Skipping.", file_path)
     except Exception as e:
         logger.error(f"Error reading file {file_path}: {str(e)}")
     return None
 
-def should_skip_directory(dir_path: str, base_path: str, gitignore, claudeignore, category_excludes) -> bool:
+@lru_cache(maxsize=65536)
+def _text_file_hash(file_path, mtime_ns, size, inode, ctime_ns, sample_size=8192):
+    """
+    Hash a text file like process_file, or return None if is_text_file would reject it
+    or it is not valid UTF-8. The file is read once for both checks.
+
+    Cached on (path, mtime, size, inode, ctime), so files unchanged since an earlier
+    traversal, e.g. a previous simulate-push request, are not read again. The inode
+    and ctime catch a same-size rewrite within the mtime granularity, or a file
+    replaced by a rename. Read errors are not cached.
+    """
+    with open(file_path, "rb") as file:
+        data = file.read()
+    if b"\x00" in data[:sample_size]:
+        logger.debug("File %s is not a text file", file_path)
+        return None
+    try:
+        content = data.decode("utf-8")
+    except UnicodeDecodeError:
+        logger.debug("Unable to read %s as UTF-8 text. Skipping.", file_path)
+        return None
+    # Newlines are translated as when the file is read in text mode
+    return compute_md5_hash(content.replace("\r\n", "\n").replace("\r", "\n"))
+
+
+def hash_text_file(file_path, file_stat=None):
+    """
+    Checks that a file is a text file and computes its MD5 hash, through a cache
+    keyed on the file's modification time, size, inode and change time. A caller that has just
+    stat'ed the file passes the result as file_stat to spare another stat call.
+
+    Returns:
+        str or None: The MD5 hash of the file's content, as process_file computes it,
+                     or None if the file is binary, not UTF-8 or cannot be read.
+    """
+    try:
+        st = file_stat or os.stat(file_path)
+        return _text_file_hash(file_path, st.st_mtime_ns, st.st_size, st.st_ino, st.st_ctime_ns)
+    except OSError as e:
+        logger.error(f"Error reading file {file_path}: {str(e)}")
+        return None
+
+
+def should_skip_directory(dir_path: str, base_path: str, gitignore, claudeignore, category_excludes,
+                          rel_path: str = None) -> bool:
     """
     Check if a directory should be skipped based on ignore patterns.
 
@@ -176,67 +450,139 @@ def should_skip_directory(dir_path: str, base_path: str, gitignore, claudeignore
         gitignore: PathSpec object for .gitignore patterns
         claudeignore: PathSpec object for .claudeignore patterns
         category_excludes: PathSpec object for category-specific exclude patterns
+        rel_path: Path of the directory relative to base_path, if the caller knows it
 
     Returns:
         bool: True if directory should be skipped, False otherwise
     """
-    rel_path = os.path.relpath(dir_path, base_path)
+    if rel_path is None:
+        rel_path = os.path.relpath(dir_path, base_path)
 
     # Check claudeignore first since it's our primary ignore mechanism
     if claudeignore and claudeignore.match_file(rel_path + '/'):
-        logger.debug(f"Skipping directory {rel_path} due to claudeignore pattern")
+        logger.debug("Skipping directory %s due to claudeignore pattern", rel_path)
         return True
 
     # Then check gitignore
     if gitignore and gitignore.match_file(rel_path + '/'):
-        logger.debug(f"Skipping directory {rel_path} due to gitignore pattern")
+        logger.debug("Skipping directory %s due to gitignore pattern", rel_path)
         return True
 
     # Finally check category excludes
     if category_excludes and category_excludes.match_file(rel_path + '/'):
-        logger.debug(f"Skipping directory {rel_path} due to category exclude pattern")
+        logger.debug("Skipping directory %s due to category exclude pattern", rel_path)
         return True
 
     return False
 
-def get_local_files(config, root_path, files_config):
+# Included files are checked and hashed in batches of this size, with the time
+# limit checked between batches
+FILE_BATCH_SIZE = 20
+# Threads used to check and hash the files of a batch concurrently
+FILE_WORKERS = 8
+# Version control and tool directories that are never synced, whatever the patterns
+EXCLUDED_DIRS = frozenset({".git", ".svn", ".hg", ".bzr", "_darcs", "CVS", "claude_chats", ".claudesync"})
+
+
+def get_local_files(config, root_path, files_config, file_sizes=None, subpath=None):
     """
     Get local files matching the patterns in files configuration with optimized directory traversal.
     Returns None if the operation takes longer than 5 seconds.
+
+    If file_sizes is given, it is filled with the size in bytes of each returned file,
+    keyed like the result, from the stat the traversal already performs.
+
+    If subpath is given (relative to root_path), only the files below that directory
+    are returned, and only that part of the tree is traversed.
     """
     # Define time limit (5 seconds)
     TIME_LIMIT = 5.0
     # Record start time (already exists, but we'll make this explicit)
     traversal_start = time_module.time()
-    # Counter for processed files
-    files_processed = 0
 
     use_ignore_files = files_config.get("use_ignore_files", True)
     gitignore = load_gitignore(root_path) if use_ignore_files else None
     claudeignore = load_claudeignore(root_path) if use_ignore_files else None
 
     files = {}
-    exclude_dirs = {".git", ".svn", ".hg", ".bzr", "_darcs", "CVS", "claude_chats", ".claudesync"}
+    exclude_dirs = EXCLUDED_DIRS
 
     # Get push_roots from configuration
     push_roots = files_config.get("push_roots", [])
     includes = files_config.get("includes", ["*"])
     excludes = files_config.get("excludes", [])
 
+    # Nothing can match an empty include list, so skip the traversal entirely
+    if not includes:
+        logger.debug("No include patterns configured, nothing to sync")
+        return files
+
     category_excludes = None
     if excludes:
-        category_excludes = pathspec.PathSpec.from_lines("gitwildmatch", excludes)
+        category_excludes = compile_pathspec(tuple(excludes))
 
-    spec = pathspec.PathSpec.from_lines("gitwildmatch", includes)
+    spec = compile_pathspec(tuple(includes))
+    # Plain paths and directory prefixes among the includes are matched without regexes
+    include_literals = literal_pattern_index(tuple(includes))
 
     logger.debug(f"Starting file system traversal at {root_path}")
     logger.debug(f"Using ignore files: {use_ignore_files}")
     logger.debug(f"Using push roots: {push_roots}")
 
     # If push_roots is specified, only traverse those directories
-    roots_to_traverse = [os.path.join(root_path, root) for root in push_roots] if push_roots else [root_path]
+    # Roots are normalized and deduplicated once, so a root listed twice (e.g. as
+    # "src" and "src/") is not walked and hashed twice
+    roots_to_traverse = list(dict.fromkeys(
+        os.path.normpath(os.path.join(root_path, root)) for root in push_roots
+    )) if push_roots else [os.path.normpath(root_path)]
+
+    # Directories are pruned by the ignore files and the category excludes alike.
+    # A negated exclude may re-include a file below an excluded directory, so
+    # excludes with negations are only matched against files.
+    dir_excludes = category_excludes
+    if category_excludes and any(pattern.include is False for pattern in category_excludes.patterns):
+        dir_excludes = None
+    prune_dirs = bool(gitignore or claudeignore or dir_excludes)
+
+    def is_pruned(dir_path, base_root):
+        """Whether walking base_root would skip dir_path or one of its parents."""
+        current = base_root
+        for part in os.path.relpath(dir_path, base_root).split(os.sep):
+            current = os.path.join(current, part)
+            # os.walk does not descend into symlinked directories, which may
+            # point outside the project
+            if part in exclude_dirs or os.path.islink(current) or (prune_dirs and should_skip_directory(
+                    current, root_path, gitignore, claudeignore, dir_excludes)):
+                return True
+        return False
+
+    if subpath:
+        # Only walk the parts of the roots that lie below subpath
+        sub_root = os.path.normpath(os.path.join(root_path, subpath))
+        narrowed_roots = []
+        for base_root in roots_to_traverse:
+            if sub_root == base_root or sub_root.startswith(base_root + os.sep):
+                if sub_root == base_root or not is_pruned(sub_root, base_root):
+                    narrowed_roots.append(sub_root)
+            elif base_root.startswith(sub_root + os.sep):
+                narrowed_roots.append(base_root)
+        roots_to_traverse = list(dict.fromkeys(narrowed_roots))
+        if not roots_to_traverse:
+            logger.debug(f"No push root covers {subpath}, nothing to sync")
+            return files
+
+    def walk_root(base_root):
+        """
+        Collect the files below one root and the stat results of those that pass
+        the size check. Returns None if the time limit is exceeded.
+        """
+        root_files = {}
+        # Stat results of the files that pass the size check, reused for their
+        # hash cache keys and, if requested, their sizes
+        root_stats = {}
+        # Counter for processed files
+        files_processed = 0
 
-    for base_root in roots_to_traverse:
         # Check time elapsed before processing each root directory
         current_time = time_module.time()
         if current_time - traversal_start > TIME_LIMIT:
@@ -245,7 +591,7 @@ def get_local_files(config, root_path, files_config):
 
         if not os.path.exists(base_root):
             logger.warning(f"Specified root path does not exist: {base_root}")
-            continue
+            return root_files, root_stats
 
         for root, dirs, filenames in os.walk(base_root, topdown=True):
             # Check time limit during directory traversal
@@ -254,10 +600,15 @@ def get_local_files(config, root_path, files_config):
                 logger.warning(f"Time limit exceeded ({current_time - traversal_start:.2f}s) during directory traversal: {root}")
                 return None
 
+            # The directory's relative path is derived once and prefixed to the
+            # names of its entries, rather than normalizing each one with relpath
+            rel_root = os.path.relpath(root, root_path)
+            rel_prefix = '' if rel_root == os.curdir else rel_root + os.sep
+
             # Filter out excluded directories first
             dirs[:] = [d for d in dirs if d not in exclude_dirs]
 
-            if use_ignore_files:
+            if prune_dirs:
                 dirs[:] = [
                     d for d in dirs
                     if not should_skip_directory(
@@ -265,36 +616,72 @@ def get_local_files(config, root_path, files_config):
                         root_path,  # Keep using root_path as base for relative paths
                         gitignore,
                         claudeignore,
-                        category_excludes
+                        dir_excludes,
+                        rel_prefix + d
                     )
                 ]
 
-            for filename in filenames:
-                files_processed += 1
+            # Match the whole directory listing against the include patterns in one call
+            rel_paths = {rel_prefix + filename: filename for filename in filenames}
+            files_processed += len(filenames)
+
+            def check_and_hash(rel_path, root=root):
+                filename = rel_paths[rel_path]
+                full_path = os.path.join(root, filename)
+                if should_process_file(
+                        config,
+                        full_path,
+                        filename,
+                        gitignore if use_ignore_files else None,
+                        root_path,
+                        claudeignore if use_ignore_files else None,
+                        category_excludes,
+                        check_text=False,
+                        file_stats=root_stats,
+                        rel_path=rel_path
+                ):
+                    # Checks for text and hashes in one read, skipped for unchanged files
+                    return hash_text_file(full_path, root_stats[rel_path])
+                return None
 
-                # Check time limit every 20 files
-                if files_processed % 20 == 0:
+            matched_paths = list(match_includes(spec, include_literals, rel_paths))
+            # Included files are checked and hashed in batches on the file
+            # pool, so their stat and read syscalls overlap. The time limit is
+            # checked between batches.
+            for batch_start in range(0, len(matched_paths), FILE_BATCH_SIZE):
+                if batch_start:
                     current_time = time_module.time()
                     if current_time - traversal_start > TIME_LIMIT:
                         logger.warning(f"Time limit exceeded ({current_time - traversal_start:.2f}s) after processing {files_processed} files")
                         return None
 
-                rel_path = os.path.relpath(os.path.join(root, filename), root_path)
-
-                if spec.match_file(rel_path):
-                    full_path = os.path.join(root, filename)
-                    if should_process_file(
-                            config,
-                            full_path,
-                            filename,
-                            gitignore if use_ignore_files else None,
-                            root_path,
-                            claudeignore if use_ignore_files else None,
-                            category_excludes
-                    ):
-                        file_hash = process_file(full_path)
-                        if file_hash:
-                            files[rel_path] = file_hash
+                batch = matched_paths[batch_start:batch_start + FILE_BATCH_SIZE]
+                if len(batch) > 1:
+                    file_hashes = file_executor.map(check_and_hash, batch)
+                else:
+                    file_hashes = map(check_and_hash, batch)
+                for rel_path, file_hash in zip(batch, file_hashes):
+                    if file_hash:
+                        root_files[rel_path] = file_hash
+
+        return root_files, root_stats
+
+    # Push roots are independent, mostly I/O-bound walks, so several of them are
+    # traversed concurrently. Results are merged in configuration order.
+    with ThreadPoolExecutor(max_workers=FILE_WORKERS) as file_executor:
+        if len(roots_to_traverse) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(roots_to_traverse))) as executor:
+                root_results = list(executor.map(walk_root, roots_to_traverse))
+        else:
+            root_results = [walk_root(roots_to_traverse[0])]
+
+    for root_result in root_results:
+        if root_result is None:
+            return None
+        root_files, root_stats = root_result
+        files.update(root_files)
+        if file_sizes is not None:
+            file_sizes.update((rel_path, root_stats[rel_path].st_size) for rel_path in root_files)
 
     traversal_time = time_module.time() - traversal_start
     logger.debug(f"File system traversal completed in {traversal_time:.2f} seconds")
@@ -363,6 +750,10 @@ def validate_and_get_provider(config, require_org=True, require_project=False):
         # not part of the provider setup
         pass
 
+    # Imported here so that commands which only need the error handling and file
+    # helpers in this module do not load the provider and its HTTP stack
+    from claudesync.provider_factory import get_provider
+
     return get_provider(config)
 
 def validate_and_store_local_path(config):
@@ -414,9 +805,5 @@ def load_claudeignore(base_path):
         pathspec.PathSpec or None: A PathSpec object containing the patterns from the .claudeignore file
                                     if the file exists; otherwise, None.
     """
-    claudeignore_path = os.path.join(base_path, ".claudeignore")
-    if os.path.exists(claudeignore_path):
-        with open(claudeignore_path, "r") as f:
-            return pathspec.PathSpec.from_lines("gitwildmatch", f)
-    return None
+    return load_ignore_file(os.path.join(base_path, ".claudeignore"))
 
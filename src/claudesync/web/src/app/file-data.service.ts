@@ -23,6 +23,43 @@ export interface FileContentResponse {
   error?: string;
 }
 
+/**
+ * Tree of included files as sent by /api/sync-data, with directories and files
+ * in separate columns. Directory row i is named dirs.names[i], and
+ * dirs.parents[i] is the row of its parent directory. Row 0 is the root, with
+ * parent -1, and every directory row comes after its parent's. File row j is
+ * named files.names[j], has size files.sizes[j] and lies in the directory of
+ * row files.parents[j]. All files in the tree are included.
+ */
+export interface ColumnarTree {
+  dirs: {
+    names: string[];
+    parents: number[];
+  };
+  files: {
+    names: string[];
+    sizes: number[];
+    parents: number[];
+  };
+}
+
+/**
+ * Rebuild the nested tree the treemap works with from its columnar form
+ * in a single pass over each column. Directories are listed before files,
+ * each in the order of their rows.
+ */
+export function expandColumnarTree(tree: ColumnarTree): any {
+  const dirs: any[] = tree.dirs.names.map(name => ({ name, children: [] }));
+  for (let i = 1; i < dirs.length; i++) {
+    dirs[tree.dirs.parents[i]].children.push(dirs[i]);
+  }
+  const files = tree.files;
+  for (let i = 0; i < files.names.length; i++) {
+    dirs[files.parents[i]].children.push({ name: files.names[i], size: files.sizes[i], included: true });
+  }
+  return dirs[0];
+}
+
 export interface SyncData {
   claudeignore: string;
   project: ProjectConfig;
@@ -44,6 +81,7 @@ export class FileDataService {
   private getSyncDataFromApi(): Observable<SyncData> {
     return this.loadingService.withLoading(
       this.http.get<SyncData>(`${this.baseUrl}/sync-data`, {}).pipe(
+        map(data => data.treemap ? { ...data, treemap: expandColumnarTree(data.treemap) } : data),
         tap(data => {
           this.cachedData = data;
           console.debug('Cached sync data updated');
@@ -76,9 +114,13 @@ export class FileDataService {
 
   getFileContent(filePath: string): Observable<FileContentResponse> {
     return this.loadingService.withLoading(
-      this.http.get<FileContentResponse>(`${this.baseUrl}/file-content`, {
-        params: { path: filePath }
-      })
+      // The file is sent as plain text rather than wrapped in JSON
+      this.http.get(`${this.baseUrl}/file-content`, {
+        params: { path: filePath },
+        responseType: 'text'
+      }).pipe(
+        map(content => ({ content }))
+      )
     );
   }
 
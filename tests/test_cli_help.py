@@ -0,0 +1,36 @@
+import inspect
+import subprocess
+import sys
+import unittest
+
+import click
+
+from claudesync.cli.main import cli
+
+
+class TestLazyCommandHelp(unittest.TestCase):
+    def test_help_does_not_import_commands(self):
+        """Listing the commands must not import their modules"""
+        script = (
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from claudesync.cli.main import cli\n"
+            "CliRunner().invoke(cli, ['--help'])\n"
+            "print(','.join(sorted(m for m in sys.modules if m.startswith('claudesync.cli.'))))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        self.assertEqual(output, "claudesync.cli.main")
+
+    def test_stored_help_matches_commands(self):
+        """The help texts listed by --help are those of the commands themselves"""
+        ctx = click.Context(cli)
+        for cmd_name, (_, help_text) in cli.lazy_subcommands.items():
+            with self.subTest(cmd_name=cmd_name):
+                cmd = cli.get_command(ctx, cmd_name)
+                self.assertEqual(help_text, inspect.cleandoc(cmd.help).split("\n\n")[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,24 @@
+import unittest
+
+from claudesync.cli.simulate import coded_etag, etag_matches
+
+
+class TestETag(unittest.TestCase):
+    def test_coded_etag(self):
+        self.assertEqual(coded_etag('"abc"', False), '"abc"')
+        self.assertEqual(coded_etag('"abc"', True), '"abc-gzip"')
+
+    def test_etag_matches_either_coding(self):
+        for if_none_match in ['"abc"', '"abc-gzip"', 'W/"abc"', 'W/"abc-gzip"', '"x", "abc-gzip"', '*']:
+            with self.subTest(if_none_match=if_none_match):
+                self.assertTrue(etag_matches(if_none_match, '"abc"'))
+                self.assertTrue(etag_matches(if_none_match, '"abc-gzip"'))
+
+    def test_etag_mismatch(self):
+        self.assertFalse(etag_matches('"abd"', '"abc"'))
+        self.assertFalse(etag_matches('"abc-br"', '"abc"'))
+        self.assertFalse(etag_matches('"x-gzip", W/"y"', '"abc"'))
+
+
+if __name__ == "__main__":
+    unittest.main()
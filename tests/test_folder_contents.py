@@ -0,0 +1,58 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from claudesync.cli.simulate import SyncDataHandler
+from claudesync.utils import get_local_files
+
+
+class TestFolderContents(unittest.TestCase):
+    def setUp(self):
+        """Create a project whose .gitignore ignores a folder of Python files"""
+        self.test_dir = tempfile.mkdtemp()
+        for rel_path, content in [
+            (".gitignore", "gen/\n"),
+            ("main.py", "x\n"),
+            ("gen/a.py", "x\n"),
+            ("gen/notes.txt", "x\n"),
+        ]:
+            path = os.path.join(self.test_dir, rel_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write(content)
+        # The handler is not bound to a connection, only its tree encoding is used
+        self.handler = SyncDataHandler.__new__(SyncDataHandler)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _folder_contents(self, files_config):
+        file_sizes = {}
+        files_to_sync = get_local_files({}, self.test_dir, files_config, file_sizes)
+        return json.loads("".join(self.handler._iter_folder_contents_json(
+            self.test_dir, "", files_to_sync, file_sizes, files_config.get("use_ignore_files", True)
+        )))
+
+    def _child(self, tree, name):
+        return next(child for child in tree["children"] if child["name"] == name)
+
+    def test_ignored_folder_is_not_descended_into(self):
+        gen = self._child(self._folder_contents({"includes": ["*.py"]}), "gen")
+        self.assertEqual(gen, {"name": "gen", "children": [], "included": False})
+
+    def test_ignore_files_not_used(self):
+        gen = self._child(self._folder_contents({"includes": ["*.py"], "use_ignore_files": False}), "gen")
+        self.assertTrue(gen["included"])
+        self.assertTrue(self._child(gen, "a.py")["included"])
+        self.assertFalse(self._child(gen, "notes.txt")["included"])
+
+        # Files in the folder are listed even if none of them is included yet
+        gen = self._child(self._folder_contents({"includes": ["*.md"], "use_ignore_files": False}), "gen")
+        self.assertFalse(gen["included"])
+        self.assertEqual(sorted(child["name"] for child in gen["children"]), ["a.py", "notes.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
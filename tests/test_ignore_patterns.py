@@ -0,0 +1,151 @@
+import unittest
+
+import pathspec
+
+from claudesync.utils import (
+    compile_pathspec,
+    combine_pattern_regexes,
+    union_pathspec,
+    literal_pattern_index,
+    match_includes,
+)
+
+# Paths every pattern set below is matched against
+PATHS = [
+    "README.md",
+    "main.py",
+    "important.log",
+    "debug.log",
+    "logs/app.log",
+    "logs/keep.txt",
+    "build",
+    "build/out.bin",
+    "src/build/gen.py",
+    "src/main.py",
+    "src/pkg/mod.py",
+    "src/pkg/deep/nested/mod.py",
+    "docs/guide.md",
+    "docs/api/index.md",
+    "node/x.js",
+    "#notes.txt",
+    "!bang.txt",
+    "*star.txt",
+    "a/b/c/d.txt",
+    "a/x/d.txt",
+    "tmp/cache/file",
+    "foo bar.txt",
+]
+
+
+def reference_matches(patterns, paths=PATHS):
+    spec = pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+    return [path for path in paths if spec.match_file(path)]
+
+
+class PathspecComparisonMixin:
+    """Compares the matching of a test case's patterns with plain PathSpec matching"""
+
+    def match(self, patterns, paths):
+        """The paths matched by patterns, a tuple, in the way under test"""
+        raise NotImplementedError
+
+    def assertMatchesLikePathspec(self, patterns):
+        self.assertCountEqual(self.match(tuple(patterns), PATHS), reference_matches(patterns))
+
+
+class TestCompilePathspec(PathspecComparisonMixin, unittest.TestCase):
+    def match(self, patterns, paths):
+        spec = compile_pathspec(patterns)
+        return [path for path in paths if spec.match_file(path)]
+
+    def test_plain_patterns(self):
+        self.assertMatchesLikePathspec(["*.log", "*.md", "main.py"])
+
+    def test_negations(self):
+        self.assertMatchesLikePathspec(["*.log", "!important.log"])
+        self.assertMatchesLikePathspec(["logs/", "!logs/keep.txt", "*.txt"])
+        self.assertMatchesLikePathspec(["*", "!*.py", "!*.md", "src/pkg/*.py"])
+
+    def test_directory_patterns(self):
+        self.assertMatchesLikePathspec(["build/", "tmp/"])
+        self.assertMatchesLikePathspec(["/build/", "docs/api/"])
+
+    def test_double_star(self):
+        self.assertMatchesLikePathspec(["**/mod.py", "docs/**"])
+        self.assertMatchesLikePathspec(["a/**/d.txt", "src/**/nested/"])
+
+    def test_anchored_patterns(self):
+        self.assertMatchesLikePathspec(["/main.py", "/build"])
+        self.assertMatchesLikePathspec(["/src/main.py", "/docs/*.md"])
+
+    def test_escaped_patterns(self):
+        self.assertMatchesLikePathspec([r"\#notes.txt", r"\!bang.txt", r"\*star.txt"])
+        self.assertMatchesLikePathspec([r"foo\ bar.txt", "*.md"])
+
+    def test_comments_and_blank_lines(self):
+        self.assertMatchesLikePathspec(["# comment", "", "*.py", "  ", "!src/main.py"])
+
+    def test_runs_are_combined(self):
+        spec = compile_pathspec(("*.log", "*.md", "!important.log", "!README.md", "*.py"))
+        self.assertEqual([pattern.include for pattern in spec.patterns], [True, False, True])
+
+    def test_nothing_to_combine(self):
+        patterns = pathspec.PathSpec.from_lines("gitwildmatch", ["*.log", "!important.log"]).patterns
+        self.assertIsNone(combine_pattern_regexes(patterns))
+
+
+class TestUnionPathspec(unittest.TestCase):
+    def assertMatchesLikeSeparateSpecs(self, gitignore_lines, claudeignore_lines):
+        gitignore = pathspec.PathSpec.from_lines("gitwildmatch", gitignore_lines)
+        claudeignore = pathspec.PathSpec.from_lines("gitwildmatch", claudeignore_lines)
+        union = union_pathspec(gitignore, claudeignore)
+        self.assertIsNotNone(union)
+        self.assertEqual(
+            [path for path in PATHS if union.match_file(path)],
+            [path for path in PATHS if gitignore.match_file(path) or claudeignore.match_file(path)],
+        )
+
+    def test_gitignore_and_claudeignore(self):
+        self.assertMatchesLikeSeparateSpecs(
+            ["build/", "*.log", "/tmp"],
+            ["docs/**", r"\#notes.txt", "**/nested/"],
+        )
+
+    def test_missing_spec(self):
+        gitignore = pathspec.PathSpec.from_lines("gitwildmatch", ["*.log", "build/"])
+        union = union_pathspec(gitignore, None)
+        self.assertEqual(
+            [path for path in PATHS if union.match_file(path)],
+            reference_matches(["*.log", "build/"]),
+        )
+
+    def test_negations_are_not_joined(self):
+        # The negation only applies within .gitignore, so the specs must stay apart
+        gitignore = pathspec.PathSpec.from_lines("gitwildmatch", ["*.log", "!important.log"])
+        claudeignore = pathspec.PathSpec.from_lines("gitwildmatch", ["docs/"])
+        self.assertIsNone(union_pathspec(gitignore, claudeignore))
+
+
+class TestLiteralPatternIndex(PathspecComparisonMixin, unittest.TestCase):
+    def match(self, patterns, paths):
+        return list(match_includes(compile_pathspec(patterns), literal_pattern_index(patterns), paths))
+
+    def test_literal_paths_and_prefixes(self):
+        self.assertMatchesLikePathspec(["README.md", "src/pkg/", "/docs", "logs"])
+
+    def test_mixed_with_wildcards(self):
+        self.assertMatchesLikePathspec(["main.py", "*.log", "a/**/d.txt", "tmp/"])
+
+    def test_escaped_patterns_are_not_literals(self):
+        patterns = (r"\#notes.txt", r"\*star.txt")
+        self.assertEqual(literal_pattern_index(patterns), (frozenset(), ()))
+        self.assertMatchesLikePathspec(patterns)
+
+    def test_negations_disable_the_index(self):
+        patterns = ("src/", "!src/main.py")
+        self.assertEqual(literal_pattern_index(patterns), (frozenset(), ()))
+        self.assertMatchesLikePathspec(patterns)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from claudesync.utils import get_local_files
+
+
+class TestGetLocalFilesSubpath(unittest.TestCase):
+    def setUp(self):
+        """Create a project with an ignored folder and a folder outside of it"""
+        self.test_dir = tempfile.mkdtemp()
+        self.root = os.path.join(self.test_dir, "project")
+        self.outside = os.path.join(self.test_dir, "outside")
+        for rel_path in [
+            "README.md",
+            "src/main.py",
+            "src/pkg/mod.py",
+            "src/pkg/deep/util.py",
+            "src/generated/out.py",
+            "docs/guide.md",
+        ]:
+            self._write(os.path.join(self.root, rel_path))
+        self._write(os.path.join(self.outside, "secret.py"))
+        self._write(os.path.join(self.root, ".gitignore"), "generated/\n")
+        self.config = {}
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _write(self, path, content="x\n"):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+
+    def _get_files(self, files_config, subpath=None):
+        return get_local_files(self.config, self.root, files_config, subpath=subpath)
+
+    def assertSubpathMatchesFullWalk(self, files_config, subpath):
+        full = self._get_files(files_config)
+        prefix = os.path.normpath(subpath) + os.sep
+        expected = {path: h for path, h in full.items() if path.startswith(prefix)}
+        self.assertEqual(self._get_files(files_config, subpath=subpath), expected)
+
+    def test_subpath_matches_full_walk(self):
+        files_config = {"includes": ["*.py", "*.md"]}
+        self.assertSubpathMatchesFullWalk(files_config, "src")
+        self.assertSubpathMatchesFullWalk(files_config, "src/pkg")
+        self.assertSubpathMatchesFullWalk(files_config, "src/pkg/")
+        self.assertSubpathMatchesFullWalk(files_config, "docs")
+
+    def test_subpath_with_push_roots(self):
+        files_config = {"includes": ["*"], "push_roots": ["src/pkg", "docs"]}
+        self.assertSubpathMatchesFullWalk(files_config, "src")
+        self.assertSubpathMatchesFullWalk(files_config, "src/pkg/deep")
+        self.assertEqual(self._get_files(files_config, subpath="src/generated"), {})
+
+    def test_ignored_subpath(self):
+        files_config = {"includes": ["*.py"]}
+        self.assertEqual(self._get_files(files_config, subpath="src/generated"), {})
+
+        files_config = {"includes": ["*.py"], "excludes": ["src/pkg/"]}
+        self.assertEqual(self._get_files(files_config, subpath="src/pkg/deep"), {})
+
+    def test_negated_exclude(self):
+        for use_ignore_files in (True, False):
+            with self.subTest(use_ignore_files=use_ignore_files):
+                files_config = {
+                    "includes": ["*.py"],
+                    "excludes": ["pkg/", "!src/pkg/mod.py"],
+                    "use_ignore_files": use_ignore_files,
+                }
+                files = self._get_files(files_config)
+                self.assertIn(os.path.join("src", "pkg", "mod.py"), files)
+                self.assertNotIn(os.path.join("src", "pkg", "deep", "util.py"), files)
+                self.assertSubpathMatchesFullWalk(files_config, "src/pkg")
+
+    def test_parent_directory_escape(self):
+        files_config = {"includes": ["*.py"]}
+        self.assertEqual(self._get_files(files_config, subpath="../outside"), {})
+        self.assertEqual(self._get_files(files_config, subpath="src/../../outside"), {})
+        # A subpath above the project root still only covers the project
+        self.assertEqual(self._get_files(files_config, subpath=".."), self._get_files(files_config))
+
+    def test_symlink_escape(self):
+        try:
+            os.symlink(self.outside, os.path.join(self.root, "src", "link"))
+        except (OSError, NotImplementedError):
+            self.skipTest("Symlinks are not supported")
+        files_config = {"includes": ["*.py"]}
+        # The full walk does not follow symlinked directories, and neither does a
+        # walk of a subpath through one
+        self.assertNotIn(os.path.join("src", "link", "secret.py"), self._get_files(files_config))
+        self.assertEqual(self._get_files(files_config, subpath="src/link"), {})
+        self.assertSubpathMatchesFullWalk(files_config, "src")
+
+
+if __name__ == "__main__":
+    unittest.main()
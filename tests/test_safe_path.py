@@ -0,0 +1,81 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from claudesync.cli.simulate import resolve_safe_path, is_safe_path
+
+
+class TestResolveSafePath(unittest.TestCase):
+    def setUp(self):
+        """Create a project with a sibling directory outside of it"""
+        self.test_dir = os.path.realpath(tempfile.mkdtemp())
+        self.root = os.path.join(self.test_dir, "project")
+        self.outside = os.path.join(self.test_dir, "project-other")
+        os.makedirs(os.path.join(self.root, "src"))
+        os.makedirs(self.outside)
+        for path in [os.path.join(self.root, "src", "main.py"), os.path.join(self.outside, "secret.py")]:
+            with open(path, "w") as f:
+                f.write("x\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _symlink(self, target, rel_path):
+        try:
+            os.symlink(target, os.path.join(self.root, rel_path))
+        except (OSError, NotImplementedError):
+            self.skipTest("Symlinks are not supported")
+
+    def test_paths_inside_the_project(self):
+        main_py = os.path.join(self.root, "src", "main.py")
+        self.assertEqual(resolve_safe_path(self.root, "src/main.py"), main_py)
+        self.assertEqual(resolve_safe_path(self.root, "src/../src/main.py"), main_py)
+        self.assertEqual(resolve_safe_path(self.root, "."), self.root)
+        self.assertEqual(resolve_safe_path(self.root, "src/missing.py"), os.path.join(self.root, "src", "missing.py"))
+
+    def test_parent_directory_escape(self):
+        self.assertIsNone(resolve_safe_path(self.root, ".."))
+        self.assertIsNone(resolve_safe_path(self.root, "../project-other/secret.py"))
+        self.assertIsNone(resolve_safe_path(self.root, "src/../../project-other/secret.py"))
+        self.assertFalse(is_safe_path(self.root, "../../etc/passwd"))
+
+    def test_absolute_path_escape(self):
+        self.assertIsNone(resolve_safe_path(self.root, os.path.join(self.outside, "secret.py")))
+
+    def test_symlink_escape(self):
+        self._symlink(self.outside, "src/link")
+        self._symlink(os.path.join(self.outside, "secret.py"), "secret.py")
+        self.assertIsNone(resolve_safe_path(self.root, "src/link"))
+        self.assertIsNone(resolve_safe_path(self.root, "src/link/secret.py"))
+        self.assertIsNone(resolve_safe_path(self.root, "secret.py"))
+
+    def test_symlink_inside_the_project(self):
+        self._symlink(os.path.join(self.root, "src"), "alias")
+        self.assertEqual(
+            resolve_safe_path(self.root, "alias/main.py"),
+            os.path.join(self.root, "src", "main.py"),
+        )
+
+    def test_retargeted_symlink(self):
+        self._symlink(os.path.join(self.root, "src"), "alias")
+        self.assertIsNotNone(resolve_safe_path(self.root, "alias/main.py"))
+        os.remove(os.path.join(self.root, "alias"))
+        self._symlink(self.outside, "alias")
+        self.assertIsNone(resolve_safe_path(self.root, "alias/secret.py"))
+
+    def test_symlinked_project_root(self):
+        root_link = os.path.join(self.test_dir, "root-link")
+        try:
+            os.symlink(self.root, root_link)
+        except (OSError, NotImplementedError):
+            self.skipTest("Symlinks are not supported")
+        self.assertEqual(
+            resolve_safe_path(root_link, "src/main.py"),
+            os.path.join(self.root, "src", "main.py"),
+        )
+        self.assertIsNone(resolve_safe_path(root_link, "../project-other/secret.py"))
+
+
+if __name__ == "__main__":
+    unittest.main()